@@ -1,5 +1,6 @@
 import os
 import uvicorn
+import structlog
 from litestar import Litestar
 from litestar.config.cors import CORSConfig
 from litestar.openapi import OpenAPIConfig
@@ -66,6 +67,13 @@ def create_app() -> Litestar:
     root_logger.setLevel(settings.LOG_LEVEL.upper() or "DEBUG")
     root_logger.addHandler(console_handler)
 
+    # Filter structlog calls by level so disabled debug calls return immediately
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(
+            logging.getLevelName(settings.LOG_LEVEL.upper() or "DEBUG")
+        ),
+    )
+
     return Litestar(
         route_handlers=[health_check, chat_completions_router, agent_router],
         cors_config=cors_config,
@@ -437,9 +437,9 @@ async def handle_client_to_deepgram(
 
             # Handle binary data (audio)
             if binary_data is not None:
-                log.debug(f"CLIENT → PROXY: [Binary data: {len(binary_data)} bytes]")
+                log.debug("CLIENT → PROXY: [Binary data]", bytes=len(binary_data))
                 await deepgram_ws.send(binary_data)
-                log.debug(f"PROXY → DEEPGRAM: [Binary data: {len(binary_data)} bytes]")
+                log.debug("PROXY → DEEPGRAM: [Binary data]", bytes=len(binary_data))
                 continue
 
             # Handle text data (JSON messages)
@@ -511,7 +511,7 @@ async def handle_deepgram_to_client(
             # Handle different message types (bytes or string)
             if isinstance(message, bytes):
                 # Binary data like audio
-                log.debug(f"Received binary data from Deepgram: {len(message)} bytes")
+                log.debug("Received binary data from Deepgram", bytes=len(message))
                 await client_ws.send_bytes(message)
                 continue
 
@@ -1,5 +1,6 @@
 import json
 import asyncio
+import logging
 from typing import Any, AsyncGenerator, List
 
 import httpx
@@ -34,7 +35,8 @@ async def chat_completion(request: Request, data: ChatCompletionRequest) -> Resp
     Also injects tools and processes tool calls if needed.
     """
     request.logger.info(RequestHelper.request_details(request))
-    request.logger.debug(RequestHelper.request_dump(request))
+    if request.logger.isEnabledFor(logging.DEBUG):
+        request.logger.debug(RequestHelper.request_dump(request))
 
     try:
         # Augment chat completion request with RAG context
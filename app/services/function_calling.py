@@ -33,7 +33,7 @@ class FunctionCallingService:
         """
         tool_definitions = get_all_tool_definitions()
 
-        logger.info(f"Found {len(tool_definitions)} tool definitions")
+        logger.info("Found %d tool definitions", len(tool_definitions))
 
         prefixed_tools = []
 
@@ -152,7 +152,7 @@ class FunctionCallingService:
 
         # Get our function definitions as Tool models
         gnosis_tools = FunctionCallingService.get_openai_function_config()
-        logger.info(f"Found {len(gnosis_tools)} tools")
+        logger.info("Found %d tools", len(gnosis_tools))
 
         # If no tools are available, return the original request
         if not gnosis_tools:
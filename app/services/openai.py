@@ -74,8 +74,9 @@ class OpenAIService:
         if data is None:
             raise ValueError("Data is required")
 
-        # Convert Pydantic model to dict if needed
-        request_data = data.model_dump()
+        # Serialize the Pydantic model straight to JSON, skipping the
+        # intermediate dict and httpx's own json encoding
+        request_body = data.model_dump_json()
 
         async with httpx.AsyncClient() as client:
             if stream:
@@ -84,19 +85,25 @@ class OpenAIService:
                     url=url,
                     method=method,
                     headers=headers,
-                    data=request_data,
+                    content=request_body,
                     timeout=timeout,
                 )
             else:
-                response = await client.request(
+                # Read the body incrementally so large result pages don't
+                # block the event loop while being buffered in one go
+                async with client.stream(
                     method=method,
                     url=url,
                     headers=headers,
-                    json=request_data,
+                    content=request_body,
                     timeout=timeout,
-                )
+                ) as response:
+                    chunks = [chunk async for chunk in response.aiter_bytes()]
+
+                content = b"".join(chunks)
+
                 return Response(
-                    content=response.content,
+                    content=content,
                     status_code=response.status_code,
                     headers=dict(response.headers),
                 )
@@ -107,7 +114,7 @@ class OpenAIService:
         url: str,
         method: str,
         headers: Dict[str, str],
-        data: Optional[Dict[str, Any]],
+        content: str,
         timeout: float,
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """
@@ -118,7 +125,7 @@ class OpenAIService:
             url: Request URL
             method: HTTP method
             headers: Request headers
-            data: Request data
+            content: Serialized JSON request body
             timeout: Request timeout
 
         Yields:
@@ -128,7 +135,7 @@ class OpenAIService:
             method=method,
             url=url,
             headers=headers,
-            json=data,
+            content=content,
             timeout=timeout,
         ) as response:
             if response.status_code >= 400:
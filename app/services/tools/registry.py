@@ -112,9 +112,9 @@ async def execute_tool(name: str, arguments: Dict[str, Any]) -> Any:
     """Execute a tool by name with the given arguments."""
     implementation = get_tool_implementation(name)
     if implementation:
-        log.debug(f"Executing tool: {name}")
+        log.debug("Executing tool", name=name)
         return await implementation(arguments)
-    log.warning(f"Tool implementation not found: {name}")
+    log.warning("Tool implementation not found", name=name)
     return {"error": f"Tool '{name}' not found"}
 
 
@@ -1,4 +1,5 @@
-import json
+import asyncio
+import orjson
 import structlog
 from typing import Dict, Any
 
@@ -9,6 +10,25 @@ from app.models.vector_store import VectorStoreSearchRequest
 # Get a logger for this module
 log = structlog.get_logger()
 
+# OpenAI vector store holding the Deepgram documentation
+VECTOR_STORE_ID = "vs_67ff646e0558819189933696b5b165b1"
+
+# Bounds applied to tool arguments before anything is sent upstream
+MIN_QUERY_LENGTH = 2
+MAX_NUM_RESULTS = 2
+MAX_BATCH_QUERIES = 5
+MAX_CONCURRENT_SEARCHES = 3
+
+# Markdown template for a single search hit
+SEARCH_RESULT_TEMPLATE = """
+## {filename}
+
+{content}
+
+**Source**: {filename}
+**Relevance**: {score:.2f}
+"""
+
 
 @register_tool(
     name="search_documentation",
@@ -31,8 +51,18 @@ Only search if the context is not enough to answer the question.
     scope="public",
 )
 async def search_documentation(arguments: Dict[str, Any]) -> Dict[str, Any]:
-    query = arguments["query"]
-    limit = arguments.get("limit", 2)
+    query = (arguments.get("query") or "").strip()
+
+    # Skip the remote call entirely for queries that can't match anything
+    if is_degenerate_query(query):
+        log.debug("Skipping documentation search for degenerate query", query=query)
+        return {"search_query": query, "data": []}
+
+    try:
+        limit = int(arguments.get("limit", MAX_NUM_RESULTS))
+    except (TypeError, ValueError):
+        limit = MAX_NUM_RESULTS
+    limit = max(1, min(limit, MAX_NUM_RESULTS))
 
     # Prepare the request data
     data = VectorStoreSearchRequest(
@@ -41,28 +71,98 @@ async def search_documentation(arguments: Dict[str, Any]) -> Dict[str, Any]:
     )
 
     response = await OpenAIService.search_vector_store(
-        store_id="vs_67ff646e0558819189933696b5b165b1",
+        store_id=VECTOR_STORE_ID,
         data=data,
     )
 
-    # Convert response to Dict[str, Any]
+    # Convert response to Dict[str, Any], parsing the raw bytes directly
     response_content = response.content
     try:
-        return json.loads(response_content)
+        return orjson.loads(response_content)
     except Exception as e:
-        log.error(f"Error parsing response content: {e}")
+        log.error("Error parsing response content", error=e)
         return {"error": str(e)}
 
 
-def format_search_result(search_result: Dict[str, Any]) -> str:
+@register_tool(
+    name="search_documentation_batch",
+    description="""
+Search technical documentation from the Deepgram docs site for several queries at once.
+
+Prefer this over multiple search_documentation calls when more than one search is needed.
+Only search if the context is not enough to answer the question.
+    """,
+    parameters={
+        "type": "object",
+        "properties": {
+            "queries": {
+                "type": "array",
+                "items": {"type": "string"},
+                "maxItems": MAX_BATCH_QUERIES,
+                "description": "The search queries",
+            },
+            "limit": {
+                "type": "integer",
+                "description": "Maximum number of results to return per query (1-2)",
+            },
+        },
+        "required": ["queries"],
+    },
+    scope="public",
+)
+async def search_documentation_batch(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    queries = arguments.get("queries")
+    if not isinstance(queries, list) or not all(isinstance(q, str) for q in queries):
+        return {"error": "queries must be a list of strings"}
+
+    if len(queries) > MAX_BATCH_QUERIES:
+        log.warning(
+            "Truncating documentation search batch",
+            requested=len(queries),
+            max_queries=MAX_BATCH_QUERIES,
+        )
+        queries = queries[:MAX_BATCH_QUERIES]
+
+    limit = arguments.get("limit", MAX_NUM_RESULTS)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SEARCHES)
+
+    async def search(query: str) -> Dict[str, Any]:
+        # Degenerate queries return immediately without taking a slot
+        if is_degenerate_query(query.strip()):
+            return {"search_query": query.strip(), "data": []}
+        async with semaphore:
+            return await search_documentation({"query": query, "limit": limit})
+
+    # Overlap the searches so latency tracks the slowest few rather than the sum,
+    # while keeping the number of upstream requests in flight bounded
+    responses = await asyncio.gather(
+        *[search(query) for query in queries],
+        return_exceptions=True,
+    )
+
+    results = []
+    for query, response in zip(queries, responses):
+        if isinstance(response, Exception):
+            log.error("Error searching documentation", query=query, error=response)
+            response = {"error": str(response)}
+        results.append({"query": query, "response": response})
+
+    return {"results": results}
+
+
+def is_degenerate_query(query: str) -> bool:
     """
-    Format the search result into a markdown string.
+    Check whether a stripped query is too short or has nothing searchable in it.
     """
-    return f"""
-## {search_result.get("filename", "Documentation")}
+    return len(query) < MIN_QUERY_LENGTH or not any(c.isalnum() for c in query)
 
-{search_result.get("content", "")}
 
-**Source**: {search_result.get("filename", "Documentation")}
-**Relevance**: {search_result.get("score", 0.0):.2f}
-"""
+def format_search_result(search_result: Dict[str, Any]) -> str:
+    """
+    Format the search result into a markdown string.
+    """
+    return SEARCH_RESULT_TEMPLATE.format(
+        filename=search_result.get("filename", "Documentation"),
+        content=search_result.get("content", ""),
+        score=search_result.get("score", 0.0),
+    )
@@ -2,20 +2,21 @@
 Utility for validating Chat Completion request bodies.
 """
 
-import json
 from typing import Dict, Any, Tuple, Union
 
+from pydantic import ValidationError
+
 from app.models.chat import ChatCompletionRequest
 
 
 def validate_chat_request(
-    request_json: str,
+    request_json: Union[str, bytes],
 ) -> Tuple[bool, Union[ChatCompletionRequest, str]]:
     """
     Validate that a JSON string can be parsed into a ChatCompletionRequest model.
 
     Args:
-        request_json: JSON string containing a chat completion request
+        request_json: JSON string or raw bytes containing a chat completion request
 
     Returns:
         A tuple containing:
@@ -23,15 +24,14 @@ def validate_chat_request(
         - Union[ChatCompletionRequest, str]: Either the parsed model or an error message
     """
     try:
-        # Parse JSON string to dictionary
-        request_data = json.loads(request_json)
-
-        # Try to create a ChatCompletionRequest from the parsed data
-        model = ChatCompletionRequest(**request_data)
+        # Parse and validate in a single pass, without an intermediate dict
+        model = ChatCompletionRequest.model_validate_json(request_json)
 
         return True, model
-    except json.JSONDecodeError as e:
-        return False, f"Invalid JSON format: {str(e)}"
+    except ValidationError as e:
+        if any(error["type"] == "json_invalid" for error in e.errors()):
+            return False, f"Invalid JSON format: {str(e)}"
+        return False, f"Validation error: {str(e)}"
     except Exception as e:
         return False, f"Validation error: {str(e)}"
 
@@ -2,7 +2,7 @@
 import argparse
 import json
 import time
-import requests
+import httpx
 from typing import Dict, Any, List
 import logging
 import sys
@@ -46,11 +46,23 @@ def print_header(model, host):
     print("═" * 41)
 
 
+def create_client(host: str) -> httpx.Client:
+    """Create a pooled HTTP client so follow-up requests reuse the connection"""
+    return httpx.Client(
+        base_url=host,
+        timeout=httpx.Timeout(60.0, connect=10.0),
+        limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=30),
+    )
+
+
 def send_chat_completion_request(
-    host: str, model: str, messages: List[Dict[str, Any]], verbose: bool = False
+    client: httpx.Client,
+    model: str,
+    messages: List[Dict[str, Any]],
+    verbose: bool = False,
 ) -> Dict[str, Any]:
     """Send a request to the chat completions API"""
-    url = f"{host}/v1/chat/completions"
+    url = "/v1/chat/completions"
 
     data = {
         "model": model,
@@ -67,7 +79,7 @@ def send_chat_completion_request(
     logger.info("[IMPORTANT] Sending chat completion request...")
     start_time = time.time()
 
-    response = requests.post(url, json=data)
+    response = client.post(url, json=data)
 
     duration_ms = (time.time() - start_time) * 1000
     logger.info(f"[INFO] Response status: {response.status_code}")
@@ -103,6 +115,7 @@ def main():
     args = parse_args()
     setup_colored_logging()
     print_header(args.model, args.host)
+    client = create_client(args.host)
 
     # First message in conversation
     logger.info("[IMPORTANT] SENDING FIRST MESSAGE (should perform RAG)")
@@ -116,7 +129,7 @@ def main():
 
     # First response should include RAG
     assistant_message = send_chat_completion_request(
-        args.host, args.model, messages, args.verbose
+        client, args.model, messages, args.verbose
     )
 
     # Print the assistant's response
@@ -138,7 +151,7 @@ def main():
     # Send the follow-up request
     time.sleep(1)  # Small delay for readability in logs
     follow_up_message = send_chat_completion_request(
-        args.host, args.model, messages, args.verbose
+        client, args.model, messages, args.verbose
     )
 
     # Print the follow-up response
@@ -146,6 +159,8 @@ def main():
         print("\nUser: How does it compare to the previous Nova-1 model?\n")
         print(f"Assistant: {follow_up_message['content']}")
 
+    client.close()
+
     print("\n[IMPORTANT] Test completed.")
 
 
@@ -1,14 +1,55 @@
 #!/usr/bin/env python3
-import json
-import requests
+import sys
+import socket
+import httpx
+import orjson
 import argparse
-import colorama
 from typing import Dict, Any
+from collections import defaultdict
 from colorama import Fore, Style
 from datetime import datetime
-
-# Initialize colorama for cross-platform color support
-colorama.init()
+from pathlib import Path
+
+# Add project root to path so the shared example helpers can be imported
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from examples.helpers.console_helper import StreamPrinter, log
+from examples.helpers.sse_helper import iter_sse_data
+
+# ANSI styles, resolved once instead of on every print
+BOLD = Style.BRIGHT
+BOLD_CYAN = Style.BRIGHT + Fore.CYAN
+BOLD_GREEN = Style.BRIGHT + Fore.GREEN
+CYAN = Fore.CYAN
+YELLOW = Fore.YELLOW
+RED = Fore.RED
+RESET = Style.RESET_ALL
+
+# Disable Nagle so the request body isn't held back waiting on a delayed ACK,
+# and use a larger kernel receive buffer so long streams need fewer recv() calls
+SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20),
+]
+
+# Operation detail fields shown in the metadata report, in display order
+DETAIL_FIELDS = (
+    ("query", 'Query: "{}"'),
+    ("result_count", "Results: {}"),
+    ("tool_call_id", "Tool Call ID: {}"),
+    ("is_internal", "Internal: {}"),
+    ("result_type", "Result type: {}"),
+)
+
+# Request fields that don't depend on the command line arguments
+REQUEST_DEFAULTS = {
+    "response_format": {"type": "text"},
+    "temperature": 1,
+    "max_completion_tokens": 2048,
+    "top_p": 1,
+    "frequency_penalty": 0,
+    "presence_penalty": 0,
+}
 
 
 def main():
@@ -41,16 +82,24 @@ Unless they ask for a specific code language, use a cURL example.
     parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
     args = parser.parse_args()
 
-    endpoint = f"{args.host}/v1/chat/completions"
+    endpoint = "/v1/chat/completions"
+
+    # Reuse one pooled connection for every request made by this script
+    client = httpx.Client(
+        base_url=args.host,
+        timeout=httpx.Timeout(60.0, connect=10.0),
+        transport=httpx.HTTPTransport(
+            limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=30),
+            socket_options=SOCKET_OPTIONS,
+        ),
+    )
 
     # Print header
-    print(f"{Style.BRIGHT}{Fore.CYAN}Gnosis Metadata Example{Style.RESET_ALL}")
+    print(f"{BOLD_CYAN}Gnosis Metadata Example{RESET}")
     print("═════════════════════════════════════════")
-    print(f"{Style.BRIGHT}Model:{Style.RESET_ALL} {args.model}")
-    print(f"{Style.BRIGHT}Host:{Style.RESET_ALL} {args.host}")
-    print(
-        f"{Style.BRIGHT}Streaming:{Style.RESET_ALL} {'Enabled' if args.stream else 'Disabled'}"
-    )
+    print(f"{BOLD}Model:{RESET} {args.model}")
+    print(f"{BOLD}Host:{RESET} {args.host}")
+    print(f"{BOLD}Streaming:{RESET} {'Enabled' if args.stream else 'Disabled'}")
     print("═════════════════════════════════════════")
 
     # Prepare the request
@@ -61,74 +110,64 @@ Unless they ask for a specific code language, use a cURL example.
             {"role": "user", "content": args.user},
         ],
         "stream": args.stream,
-        "response_format": {"type": "text"},
-        "temperature": 1,
-        "max_completion_tokens": 2048,
-        "top_p": 1,
-        "frequency_penalty": 0,
-        "presence_penalty": 0,
+        **REQUEST_DEFAULTS,
     }
 
     if args.verbose:
-        print(f"{Fore.CYAN}[VERBOSE]{Style.RESET_ALL} Request data:")
-        print(json.dumps(request_data, indent=2))
+        print(f"{CYAN}[VERBOSE]{RESET} Request data:")
+        print(orjson.dumps(request_data, option=orjson.OPT_INDENT_2).decode())
+
+    # Serialize the request body once, up front
+    request_body = orjson.dumps(request_data)
 
     log("Sending chat completion request...", "important", args.verbose)
     start_time = datetime.now()
-    print(f"\n{Style.BRIGHT}User:{Style.RESET_ALL} {args.user}\n")
+    print(f"\n{BOLD}User:{RESET} {args.user}\n")
 
     if args.stream:
-        print(
-            f"{Fore.YELLOW}[WARNING] Metadata is not available in streaming mode{Style.RESET_ALL}"
-        )
-        print(
-            f"{Style.BRIGHT}{Fore.GREEN}Assistant:{Style.RESET_ALL} ",
-            end="",
-            flush=True,
-        )
+        print(f"{YELLOW}[WARNING] Metadata is not available in streaming mode{RESET}")
+        print(f"{BOLD_GREEN}Assistant:{RESET} ", end="", flush=True)
 
         # Handle streaming response
-        response = requests.post(
+        with client.stream(
+            "POST",
             endpoint,
-            json=request_data,
+            content=request_body,
             headers={"Content-Type": "application/json"},
-            stream=True,
-        )
-
-        # Process the streaming response
-        for line in response.iter_lines():
-            if not line:
-                continue
-
-            line = line.decode("utf-8")
-            if not line.startswith("data: "):
-                continue
-
-            data = line[6:]  # Remove 'data: ' prefix
-
-            if data == "[DONE]":
-                break
-
-            try:
-                json_data = json.loads(data)
-
-                if args.verbose:
-                    log(f"Received chunk: {data}", "debug", args.verbose)
-
-                # Extract content from the delta
-                if "choices" in json_data and len(json_data["choices"]) > 0:
-                    delta = json_data["choices"][0].get("delta", {})
+        ) as response:
+            # Buffer streamed tokens and flush them to the terminal in batches
+            printer = StreamPrinter()
+
+            # Process the streaming response
+            for data in iter_sse_data(response):
+                try:
+                    json_data = orjson.loads(data)
+
+                    if args.verbose:
+                        log(f"Received chunk: {data.decode()}", "debug", args.verbose)
+
+                    # Extract content from the delta
+                    try:
+                        delta = json_data["choices"][0]["delta"]
+                    except (KeyError, IndexError):
+                        continue
+
+                    content = delta.get("content")
+                    if content:
+                        printer.write(content)
+                except orjson.JSONDecodeError:
+                    if args.verbose:
+                        log(
+                            f"Error parsing JSON: {data.decode()}",
+                            "error",
+                            args.verbose,
+                        )
 
-                    if "content" in delta and delta["content"]:
-                        # Print content immediately as it arrives
-                        print(delta["content"], end="", flush=True)
-            except json.JSONDecodeError:
-                if args.verbose:
-                    log(f"Error parsing JSON: {data}", "error", args.verbose)
+            printer.close()
     else:
         # Handle non-streaming response
-        response = requests.post(
-            endpoint, json=request_data, headers={"Content-Type": "application/json"}
+        response = client.post(
+            endpoint, content=request_body, headers={"Content-Type": "application/json"}
         )
 
         end_time = datetime.now()
@@ -138,29 +177,29 @@ Unless they ask for a specific code language, use a cURL example.
             log(f"Response status: {response.status_code}", "info", args.verbose)
 
         try:
-            response_data = response.json()
+            response_data = orjson.loads(response.content)
 
             if args.verbose:
                 log("Full response:", "debug", args.verbose)
-                print(json.dumps(response_data, indent=2))
+                print(orjson.dumps(response_data, option=orjson.OPT_INDENT_2).decode())
 
             # Extract and print the content
             if "choices" in response_data and len(response_data["choices"]) > 0:
                 content = response_data["choices"][0]["message"].get("content", "")
-                print(
-                    f"{Style.BRIGHT}{Fore.GREEN}Assistant:{Style.RESET_ALL} {content}"
-                )
+                print(f"{BOLD_GREEN}Assistant:{RESET} {content}")
 
                 # Check for metadata
                 print_metadata_report(response_data, duration)
 
             else:
                 log("Unexpected response format", "error", args.verbose)
-                print(json.dumps(response_data, indent=2))
-        except json.JSONDecodeError:
+                print(orjson.dumps(response_data, option=orjson.OPT_INDENT_2).decode())
+        except orjson.JSONDecodeError:
             log(f"Error parsing response: {response.text}", "error", args.verbose)
             print(response.text)
 
+    client.close()
+
     print("\n")
     log("Request completed.", "important", args.verbose)
 
@@ -170,18 +209,18 @@ def print_metadata_report(
 ) -> None:
     """Print a detailed report of metadata and token usage."""
     print("\n" + "═" * 60)
-    print(f"{Style.BRIGHT}{Fore.CYAN}GNOSIS METADATA REPORT{Style.RESET_ALL}")
+    print(f"{BOLD_CYAN}GNOSIS METADATA REPORT{RESET}")
     print("═" * 60)
 
     # Check if metadata exists
     if "gnosis_metadata" not in response_data:
-        print(f"{Fore.RED}No Gnosis metadata available in response{Style.RESET_ALL}")
+        print(f"{RED}No Gnosis metadata available in response{RESET}")
         return
 
     metadata = response_data["gnosis_metadata"]
 
     # 1. Summary Section
-    print(f"\n{Style.BRIGHT}Summary:{Style.RESET_ALL}")
+    print(f"\n{BOLD}Summary:{RESET}")
     print(f"  • {metadata.get('summary', 'No summary available')}")
     print(f"  • Total latency: {metadata.get('total_latency_ms', 'N/A'):.2f}ms")
     if "usage" in response_data:
@@ -195,28 +234,23 @@ def print_metadata_report(
     # 2. Operations Breakdown
     operations = metadata.get("operations", [])
     if operations:
-        print(f"\n{Style.BRIGHT}Operations:{Style.RESET_ALL}")
+        print(f"\n{BOLD}Operations:{RESET}")
 
         # Group operations by type
-        op_by_type = {}
+        op_by_type = defaultdict(list)
         for op in operations:
-            op_type = op.get("operation_type", "unknown")
-            if op_type not in op_by_type:
-                op_by_type[op_type] = []
-            op_by_type[op_type].append(op)
+            op_by_type[op.get("operation_type", "unknown")].append(op)
 
         # Print each operation type
         for op_type, ops in op_by_type.items():
-            print(
-                f"\n  {Style.BRIGHT}{op_type.upper()} OPERATIONS ({len(ops)}){Style.RESET_ALL}"
-            )
+            print(f"\n  {BOLD}{op_type.upper()} OPERATIONS ({len(ops)}){RESET}")
 
             for i, op in enumerate(ops, 1):
                 name = op.get("name", "unnamed")
                 latency = op.get("latency_ms", "N/A")
                 tokens = op.get("tokens", "N/A")
 
-                print(f"  {i}. {Fore.YELLOW}{name}{Style.RESET_ALL}")
+                print(f"  {i}. {YELLOW}{name}{RESET}")
                 print(
                     f"     • Latency: {latency if latency == 'N/A' else f'{latency:.2f}ms'}"
                 )
@@ -225,25 +259,17 @@ def print_metadata_report(
                 # Print operation details if available
                 details = op.get("details", {})
                 if details:
-                    if "query" in details:
-                        print(f"     • Query: \"{details['query']}\"")
-                    if "result_count" in details:
-                        print(f"     • Results: {details['result_count']}")
-                    if "tool_call_id" in details:
-                        print(f"     • Tool Call ID: {details['tool_call_id']}")
-                    if "is_internal" in details:
-                        print(f"     • Internal: {details['is_internal']}")
-                    if "arguments" in details and details["arguments"] != "{}":
+                    for key, label in DETAIL_FIELDS:
+                        value = details.get(key)
+                        if value is not None:
+                            print(f"     • {label.format(value)}")
+                    if details.get("arguments", "{}") != "{}":
                         print(f"     • Arguments: {details['arguments']}")
-                    if "result_type" in details:
-                        print(f"     • Result type: {details['result_type']}")
                     if "error" in details:
-                        print(
-                            f"     • {Fore.RED}Error: {details['error']}{Style.RESET_ALL}"
-                        )
+                        print(f"     • {RED}Error: {details['error']}{RESET}")
 
     # 3. Performance Metrics
-    print(f"\n{Style.BRIGHT}Performance Metrics:{Style.RESET_ALL}")
+    print(f"\n{BOLD}Performance Metrics:{RESET}")
     print(f"  • Client-measured total duration: {total_request_duration:.2f}ms")
     if "total_latency_ms" in metadata:
         server_latency = metadata["total_latency_ms"]
@@ -252,23 +278,5 @@ def print_metadata_report(
     print("═" * 60)
 
 
-def log(message, level="info", verbose=False):
-    """Log a message with appropriate formatting if verbose mode is enabled."""
-    if not verbose and level != "important":
-        return
-
-    prefix = ""
-    if level == "info":
-        prefix = f"{Fore.CYAN}[INFO]{Style.RESET_ALL}"
-    elif level == "important":
-        prefix = f"{Fore.YELLOW}[IMPORTANT]{Style.RESET_ALL}"
-    elif level == "error":
-        prefix = f"{Fore.RED}[ERROR]{Style.RESET_ALL}"
-    elif level == "debug":
-        prefix = f"{Fore.MAGENTA}[DEBUG]{Style.RESET_ALL}"
-
-    print(f"{prefix} {message}")
-
-
 if __name__ == "__main__":
     main()
@@ -1,27 +1,62 @@
 #!/usr/bin/env python3
+import ast
+import sys
 import json
-import requests
+import asyncio
+import aiohttp
+import orjson
 import argparse
-import colorama
 import time
 from colorama import Fore, Style
-from concurrent.futures import ThreadPoolExecutor
-
-# Initialize colorama for cross-platform color support
-colorama.init()
-
-
-def main():
-    parser = argparse.ArgumentParser(
-        description="Parallel Tool Calling Test for Gnosis"
-    )
-    parser.add_argument(
-        "--host", default="http://localhost:8080", help="Base URL of the Gnosis API"
-    )
-    parser.add_argument("--model", default="gpt-4o", help="OpenAI model to use")
-    parser.add_argument(
-        "--system",
-        default="""
+from functools import lru_cache
+from pathlib import Path
+
+# Add project root to path so the shared example helpers can be imported
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from examples.helpers.console_helper import log
+
+# ANSI styles and fixed output strings, resolved once at import time
+BOLD = Style.BRIGHT
+RESET = Style.RESET_ALL
+HEADER_TITLE = f"{BOLD}{Fore.CYAN}Parallel Tool Calling Test Example{RESET}"
+HEADER_BAR = "═" * 41
+USER_PREFIX = f"{BOLD}User:{RESET} "
+ASSISTANT_PREFIX = f"{BOLD}{Fore.GREEN}Assistant:{RESET} "
+
+# Serialized user tool results keyed by function name and canonical arguments
+TOOL_RESULT_CACHE = {}
+
+# AST nodes permitted in expressions passed to the calculate tool
+ALLOWED_EXPRESSION_NODES = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Constant,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.FloorDiv,
+    ast.Mod,
+    ast.Pow,
+    ast.UAdd,
+    ast.USub,
+)
+
+# Largest exponent accepted by the calculate tool; powers must also have literal
+# operands, so an expression like 9**9**9**9 can't run away with CPU and memory
+MAX_EXPONENT = 100
+
+# Command line options, built once at import time
+PARSER = argparse.ArgumentParser(description="Parallel Tool Calling Test for Gnosis")
+PARSER.add_argument(
+    "--host", default="http://localhost:8080", help="Base URL of the Gnosis API"
+)
+PARSER.add_argument("--model", default="gpt-4o", help="OpenAI model to use")
+PARSER.add_argument(
+    "--system",
+    default="""
 You are a helpful assistant with access to both built-in tools and user-defined tools.
 You can use built-in tool calls to find information in our documentation.
 You can also use two user-defined tools:
@@ -30,26 +65,27 @@ You can also use two user-defined tools:
 
 When you need information from multiple sources, you should make tool calls in parallel.
                        """,
-        help="System message",
-    )
-    parser.add_argument(
-        "--user",
-        default="I need to know about Deepgram's Nova-2 model features, the weather in San Francisco, and what is 123 * 456?",
-        help="User message",
-    )
-    parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
-    args = parser.parse_args()
+    help="System message",
+)
+PARSER.add_argument(
+    "--user",
+    default="I need to know about Deepgram's Nova-2 model features, the weather in San Francisco, and what is 123 * 456?",
+    help="User message",
+)
+PARSER.add_argument("--verbose", action="store_true", help="Enable verbose output")
+
+
+async def main():
+    args = PARSER.parse_args()
 
     endpoint = f"{args.host}/v1/chat/completions"
 
     # Print header
-    print(
-        f"{Style.BRIGHT}{Fore.CYAN}Parallel Tool Calling Test Example{Style.RESET_ALL}"
-    )
-    print("═════════════════════════════════════════")
-    print(f"{Style.BRIGHT}Model:{Style.RESET_ALL} {args.model}")
-    print(f"{Style.BRIGHT}Host:{Style.RESET_ALL} {args.host}")
-    print("═════════════════════════════════════════")
+    print(HEADER_TITLE)
+    print(HEADER_BAR)
+    print(f"{BOLD}Model:{RESET} {args.model}")
+    print(f"{BOLD}Host:{RESET} {args.host}")
+    print(HEADER_BAR)
 
     # Define user tools
     user_tools = [
@@ -104,26 +140,41 @@ When you need information from multiple sources, you should make tool calls in p
     }
 
     if args.verbose:
-        print(f"{Fore.CYAN}[VERBOSE]{Style.RESET_ALL} Request data:")
-        print(json.dumps(request_data, indent=2))
+        print(f"{Fore.CYAN}[VERBOSE]{RESET} Request data:")
+        print(pretty_json(request_data))
 
     log("Sending chat completion request...", "important", args.verbose)
-    print(f"\n{Style.BRIGHT}User:{Style.RESET_ALL} {args.user}\n")
+    print(f"\n{USER_PREFIX}{args.user}\n")
+
+    # Share one session, and its keep-alive connection, between both requests,
+    # and close it however the exchange ends
+    async with aiohttp.ClientSession(
+        headers={"Content-Type": "application/json"},
+        connector=aiohttp.TCPConnector(
+            limit=8, keepalive_timeout=30, ttl_dns_cache=300
+        ),
+    ) as session:
+        await run_tool_calling(session, endpoint, request_data, args)
+
+    print("\n")
+    log("Request completed.", "important", args.verbose)
+
 
+async def run_tool_calling(session, endpoint, request_data, args):
+    """Send the request, run any user tool calls, and send their results back."""
     # Send the initial request
-    response = requests.post(
-        endpoint, json=request_data, headers={"Content-Type": "application/json"}
-    )
+    async with session.post(endpoint, data=orjson.dumps(request_data)) as response:
+        if args.verbose:
+            log(f"Response status: {response.status}", "info", args.verbose)
 
-    if args.verbose:
-        log(f"Response status: {response.status_code}", "info", args.verbose)
+        raw = await response.read()
 
     try:
-        response_data = response.json()
+        response_data = orjson.loads(raw)
 
         if args.verbose:
             log("Full initial response:", "debug", args.verbose)
-            print(json.dumps(response_data, indent=2))
+            print(pretty_json(response_data))
 
         # Check for gnosis_metadata to show what happened on the server
         if "gnosis_metadata" in response_data:
@@ -148,7 +199,7 @@ When you need information from multiple sources, you should make tool calls in p
                     f"Found {len(tool_calls)} tool calls in response", "important", True
                 )
 
-                # Process user-defined tool calls in parallel using ThreadPoolExecutor
+                # Process user-defined tool calls concurrently on the event loop
                 if tool_calls:
                     log(
                         f"Processing {len(tool_calls)} user-defined tool calls in parallel",
@@ -156,24 +207,34 @@ When you need information from multiple sources, you should make tool calls in p
                         True,
                     )
 
-                    # Define a function to process a single tool call
-                    def process_tool_call(tool_call):
+                    # Define a coroutine to process a single tool call
+                    async def process_tool_call(tool_call):
                         tool_id = tool_call["id"]
                         function_name = tool_call["function"]["name"]
-                        function_args = json.loads(tool_call["function"]["arguments"])
+                        function_args = orjson.loads(tool_call["function"]["arguments"])
 
-                        # Simulate executing user-defined tools
-                        log(f"Executing user tool: {function_name}", "info", True)
-                        result = simulate_user_tool_execution(
-                            function_name, function_args
+                        # Reuse the serialized result of an identical earlier call
+                        cache_key = (
+                            function_name,
+                            orjson.dumps(function_args, option=orjson.OPT_SORT_KEYS),
                         )
+                        content = TOOL_RESULT_CACHE.get(cache_key)
+                        if content is None:
+                            # Simulate executing user-defined tools
+                            log(f"Executing user tool: {function_name}", "info", True)
+                            result = await simulate_user_tool_execution(
+                                function_name, function_args
+                            )
+                            content = dump_tool_result(result)
+                            TOOL_RESULT_CACHE[cache_key] = content
 
-                        return {"tool_call_id": tool_id, "result": result}
+                        return {"tool_call_id": tool_id, "content": content}
 
                     # Execute all user-defined tool calls in parallel
                     start_time = time.time()
-                    with ThreadPoolExecutor(max_workers=len(tool_calls)) as executor:
-                        user_results = list(executor.map(process_tool_call, tool_calls))
+                    user_results = await asyncio.gather(
+                        *(process_tool_call(tool_call) for tool_call in tool_calls)
+                    )
 
                     execution_time = (time.time() - start_time) * 1000
                     log(
@@ -182,26 +243,20 @@ When you need information from multiple sources, you should make tool calls in p
                         True,
                     )
 
-                    # Prepare the follow-up request
-                    # Start with the original messages
-                    next_messages = request_data["messages"].copy()
-
-                    # Add the assistant's message with tool calls
-                    next_messages.append(message)
-
-                    # Add the user tool results to the messages
-                    for result_obj in user_results:
-                        tool_id = result_obj["tool_call_id"]
-                        result = result_obj["result"]
-
-                        # Add the tool result message
-                        next_messages.append(
+                    # Prepare the follow-up request: the original messages, the
+                    # assistant's message with tool calls, then one tool result each
+                    next_messages = [
+                        *request_data["messages"],
+                        message,
+                        *(
                             {
                                 "role": "tool",
-                                "tool_call_id": tool_id,
-                                "content": json.dumps(result),
+                                "tool_call_id": result_obj["tool_call_id"],
+                                "content": result_obj["content"],
                             }
-                        )
+                            for result_obj in user_results
+                        ),
+                    ]
 
                     # Create a follow-up request with the tool results
                     follow_up_request = {
@@ -216,20 +271,17 @@ When you need information from multiple sources, you should make tool calls in p
                         log(
                             "Sending follow-up request with tool results:", "info", True
                         )
-                        print(json.dumps(follow_up_request, indent=2))
+                        print(pretty_json(follow_up_request))
 
                     # Send the follow-up request
-                    follow_up_response = requests.post(
-                        endpoint,
-                        json=follow_up_request,
-                        headers={"Content-Type": "application/json"},
-                    )
-
-                    follow_up_data = follow_up_response.json()
+                    async with session.post(
+                        endpoint, data=orjson.dumps(follow_up_request)
+                    ) as follow_up_response:
+                        follow_up_data = orjson.loads(await follow_up_response.read())
 
                     if args.verbose:
                         log("Follow-up response:", "debug", True)
-                        print(json.dumps(follow_up_data, indent=2))
+                        print(pretty_json(follow_up_data))
 
                     # Print the final response
                     if (
@@ -239,9 +291,7 @@ When you need information from multiple sources, you should make tool calls in p
                         final_content = follow_up_data["choices"][0]["message"].get(
                             "content", ""
                         )
-                        print(
-                            f"{Style.BRIGHT}{Fore.GREEN}Assistant:{Style.RESET_ALL} {final_content}"
-                        )
+                        print(f"{ASSISTANT_PREFIX}{final_content}")
 
                         # Check if there are still tool calls in the response
                         if "tool_calls" in follow_up_data["choices"][0]["message"]:
@@ -255,21 +305,17 @@ When you need information from multiple sources, you should make tool calls in p
             else:
                 # No tool calls, just print the response
                 content = message.get("content", "")
-                print(
-                    f"{Style.BRIGHT}{Fore.GREEN}Assistant:{Style.RESET_ALL} {content}"
-                )
+                print(f"{ASSISTANT_PREFIX}{content}")
         else:
             log("Unexpected response format", "error", args.verbose)
-            print(json.dumps(response_data, indent=2))
-    except json.JSONDecodeError:
-        log(f"Error parsing response: {response.text}", "error", args.verbose)
-        print(response.text)
-
-    print("\n")
-    log("Request completed.", "important", args.verbose)
+            print(pretty_json(response_data))
+    except orjson.JSONDecodeError:
+        response_text = raw.decode("utf-8", "replace")
+        log(f"Error parsing response: {response_text}", "error", args.verbose)
+        print(response_text)
 
 
-def simulate_user_tool_execution(function_name, args):
+async def simulate_user_tool_execution(function_name, args):
     """Simulate executing a user-defined tool."""
     log(
         f"Simulating execution of user tool: {function_name} with args: {args}",
@@ -278,7 +324,7 @@ def simulate_user_tool_execution(function_name, args):
     )
 
     # Add a small delay to simulate tool execution time
-    time.sleep(1)
+    await asyncio.sleep(1)
 
     if function_name == "get_weather":
         location = args.get("location", "Unknown")
@@ -292,8 +338,9 @@ def simulate_user_tool_execution(function_name, args):
     elif function_name == "calculate":
         expression = args.get("expression", "")
         try:
-            # WARNING: eval is unsafe in production, this is just for demonstration
-            result = eval(expression)
+            # Only plain arithmetic with small literal powers is allowed, so this
+            # can't execute arbitrary code or build enormous numbers
+            result = eval(compile_expression(expression), {"__builtins__": {}}, {})
             return {"result": result}
         except Exception as e:
             return {"error": str(e)}
@@ -301,23 +348,49 @@ def simulate_user_tool_execution(function_name, args):
         return {"error": f"Unknown function: {function_name}"}
 
 
-def log(message, level="info", verbose=False):
-    """Log a message with appropriate formatting if verbose mode is enabled."""
-    if not verbose and level != "important":
-        return
+@lru_cache(maxsize=1024)
+def compile_expression(expression):
+    """Parse and compile an arithmetic expression, rejecting anything else."""
+    tree = ast.parse(expression, mode="eval")
+    for node in ast.walk(tree):
+        if not isinstance(node, ALLOWED_EXPRESSION_NODES):
+            raise ValueError(f"Unsupported expression: {type(node).__name__}")
+        if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+            raise ValueError(f"Unsupported constant: {node.value!r}")
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Pow):
+            exponent = literal_number(node.right)
+            if literal_number(node.left) is None or exponent is None:
+                raise ValueError("Powers must have literal operands")
+            if abs(exponent) > MAX_EXPONENT:
+                raise ValueError(f"Exponent is larger than {MAX_EXPONENT}")
+    return compile(tree, "<calculate>", "eval")
+
+
+def literal_number(node):
+    """Return the value of a numeric literal, optionally signed, or None."""
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+        value = literal_number(node.operand)
+        if value is not None and isinstance(node.op, ast.USub):
+            return -value
+        return value
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return node.value
+    return None
+
+
+def dump_tool_result(result):
+    """Serialize a tool result, falling back to json for values orjson rejects."""
+    try:
+        return orjson.dumps(result).decode()
+    except orjson.JSONEncodeError:
+        # orjson only encodes 64-bit integers, but calculate can return 2**70
+        return json.dumps(result)
 
-    prefix = ""
-    if level == "info":
-        prefix = f"{Fore.CYAN}[INFO]{Style.RESET_ALL}"
-    elif level == "important":
-        prefix = f"{Fore.YELLOW}[IMPORTANT]{Style.RESET_ALL}"
-    elif level == "error":
-        prefix = f"{Fore.RED}[ERROR]{Style.RESET_ALL}"
-    elif level == "debug":
-        prefix = f"{Fore.MAGENTA}[DEBUG]{Style.RESET_ALL}"
 
-    print(f"{prefix} {message}")
+def pretty_json(obj):
+    """Format an object as indented JSON for verbose output."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
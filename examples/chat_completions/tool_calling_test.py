@@ -1,12 +1,16 @@
 #!/usr/bin/env python3
-import json
-import requests
+import sys
+import httpx
+import orjson
 import argparse
-import colorama
 from colorama import Fore, Style
+from pathlib import Path
 
-# Initialize colorama for cross-platform color support
-colorama.init()
+# Add project root to path so the shared example helpers can be imported
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from examples.helpers.console_helper import StreamPrinter, log
+from examples.helpers.sse_helper import iter_sse_data
 
 
 def main():
@@ -32,7 +36,14 @@ When asked about technical documentation, ALWAYS use the search_documentation to
     parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
     args = parser.parse_args()
 
-    endpoint = f"{args.host}/v1/chat/completions"
+    endpoint = "/v1/chat/completions"
+
+    # Reuse one pooled connection for every request made by this script
+    client = httpx.Client(
+        base_url=args.host,
+        timeout=httpx.Timeout(60.0, connect=10.0),
+        limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=30),
+    )
 
     # Print header
     print(f"{Style.BRIGHT}{Fore.CYAN}Tool Calling Test Example{Style.RESET_ALL}")
@@ -59,7 +70,7 @@ When asked about technical documentation, ALWAYS use the search_documentation to
 
     if args.verbose:
         print(f"{Fore.CYAN}[VERBOSE]{Style.RESET_ALL} Request data:")
-        print(json.dumps(request_data, indent=2))
+        print(pretty_json(request_data))
 
     log("Sending chat completion request...", "important", args.verbose)
     print(f"\n{Style.BRIGHT}User:{Style.RESET_ALL} {args.user}\n")
@@ -67,46 +78,37 @@ When asked about technical documentation, ALWAYS use the search_documentation to
 
     if args.stream:
         # Handle streaming response
-        response = requests.post(
+        with client.stream(
+            "POST",
             endpoint,
             json=request_data,
             headers={"Content-Type": "application/json"},
-            stream=True,
-        )
-
-        # Process the streaming response
-        for line in response.iter_lines():
-            if not line:
-                continue
+        ) as response:
+            # Buffer streamed tokens and flush them to the terminal in batches
+            printer = StreamPrinter()
 
-            line = line.decode("utf-8")
-            if not line.startswith("data: "):
-                continue
+            # Process the streaming response
+            for data in iter_sse_data(response):
+                try:
+                    json_data = orjson.loads(data)
 
-            data = line[6:]  # Remove 'data: ' prefix
+                    if args.verbose:
+                        log(f"Received chunk: {data.decode()}", "debug", args.verbose)
 
-            if data == "[DONE]":
-                break
+                    # Extract content from the delta
+                    if "choices" in json_data and len(json_data["choices"]) > 0:
+                        delta = json_data["choices"][0].get("delta", {})
 
-            try:
-                json_data = json.loads(data)
+                        if "content" in delta and delta["content"]:
+                            printer.write(delta["content"])
+                except orjson.JSONDecodeError:
+                    if args.verbose:
+                        log(f"Error parsing JSON: {data!r}", "error", args.verbose)
 
-                if args.verbose:
-                    log(f"Received chunk: {data}", "debug", args.verbose)
-
-                # Extract content from the delta
-                if "choices" in json_data and len(json_data["choices"]) > 0:
-                    delta = json_data["choices"][0].get("delta", {})
-
-                    if "content" in delta and delta["content"]:
-                        # Print content immediately as it arrives
-                        print(delta["content"], end="", flush=True)
-            except json.JSONDecodeError:
-                if args.verbose:
-                    log(f"Error parsing JSON: {data}", "error", args.verbose)
+            printer.close()
     else:
         # Handle non-streaming response
-        response = requests.post(
+        response = client.post(
             endpoint, json=request_data, headers={"Content-Type": "application/json"}
         )
 
@@ -114,11 +116,12 @@ When asked about technical documentation, ALWAYS use the search_documentation to
             log(f"Response status: {response.status_code}", "info", args.verbose)
 
         try:
-            response_data = response.json()
+            # Parse straight from the raw body rather than decoding it to str first
+            response_data = orjson.loads(response.content)
 
             if args.verbose:
                 log("Full response:", "debug", args.verbose)
-                print(json.dumps(response_data, indent=2))
+                print(pretty_json(response_data))
 
             # Extract and print the content
             if "choices" in response_data and len(response_data["choices"]) > 0:
@@ -136,34 +139,24 @@ When asked about technical documentation, ALWAYS use the search_documentation to
 
                     for i, tool_call in enumerate(tool_calls):
                         log(f"Tool call #{i+1}:", "important", True)
-                        print(json.dumps(tool_call, indent=2))
+                        print(pretty_json(tool_call))
             else:
                 log("Unexpected response format", "error", args.verbose)
-                print(json.dumps(response_data, indent=2))
-        except json.JSONDecodeError:
-            log(f"Error parsing response: {response.text}", "error", args.verbose)
-            print(response.text)
+                print(pretty_json(response_data))
+        except orjson.JSONDecodeError:
+            text = response.content.decode("utf-8", "replace")
+            log(f"Error parsing response: {text}", "error", args.verbose)
+            print(text)
+
+    client.close()
 
     print("\n")
     log("Request completed.", "important", args.verbose)
 
 
-def log(message, level="info", verbose=False):
-    """Log a message with appropriate formatting if verbose mode is enabled."""
-    if not verbose and level != "important":
-        return
-
-    prefix = ""
-    if level == "info":
-        prefix = f"{Fore.CYAN}[INFO]{Style.RESET_ALL}"
-    elif level == "important":
-        prefix = f"{Fore.YELLOW}[IMPORTANT]{Style.RESET_ALL}"
-    elif level == "error":
-        prefix = f"{Fore.RED}[ERROR]{Style.RESET_ALL}"
-    elif level == "debug":
-        prefix = f"{Fore.MAGENTA}[DEBUG]{Style.RESET_ALL}"
-
-    print(f"{prefix} {message}")
+def pretty_json(obj):
+    """Format an object as indented JSON for verbose output."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# console_helper.py
+# Helper module for the colored logging and streamed output of the chat examples
+
+import sys
+import time
+
+import colorama
+from colorama import Fore, Style
+
+# ANSI colors work natively outside Windows, so only wrap stdout there
+if sys.platform == "win32":
+    colorama.init()
+
+# Minimum number of seconds between terminal flushes while streaming
+STREAM_FLUSH_INTERVAL = 0.03
+
+# Colored log prefixes, built once rather than on every log() call
+LOG_PREFIXES = {
+    "info": f"{Fore.CYAN}[INFO]{Style.RESET_ALL}",
+    "important": f"{Fore.YELLOW}[IMPORTANT]{Style.RESET_ALL}",
+    "error": f"{Fore.RED}[ERROR]{Style.RESET_ALL}",
+    "debug": f"{Fore.MAGENTA}[DEBUG]{Style.RESET_ALL}",
+}
+
+
+def log(message, level="info", verbose=False):
+    """
+    Log a message with a colored level prefix
+
+    Args:
+        message: The message to print
+        level: One of the LOG_PREFIXES levels
+        verbose: Print every level rather than only "important" messages
+    """
+    if not verbose and level != "important":
+        return
+
+    print(f"{LOG_PREFIXES.get(level, '')} {message}")
+
+
+class StreamPrinter:
+    """
+    Write streamed text to stdout, flushing the terminal in batches
+
+    Flushing on every token makes the terminal the bottleneck for fast streams,
+    so while tokens arrive quickly output is flushed at most once every
+    STREAM_FLUSH_INTERVAL seconds. The first write, and any write that follows a
+    gap longer than the interval (a slow stream or a server-side pause), is
+    flushed straight away, and anything left is flushed when the printer closes.
+    """
+
+    def __init__(self, flush_interval: float = STREAM_FLUSH_INTERVAL):
+        self.flush_interval = flush_interval
+        self._write = sys.stdout.write
+        self._flush = sys.stdout.flush
+        self._last_flush = None
+        self._last_write = None
+
+    def __enter__(self) -> "StreamPrinter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def write(self, text: str) -> None:
+        """Write text, flushing unless it is part of a fast burst of tokens"""
+        self._write(text)
+
+        now = time.monotonic()
+        if (
+            self._last_write is None
+            or now - self._last_write >= self.flush_interval
+            or now - self._last_flush >= self.flush_interval
+        ):
+            self._flush()
+            self._last_flush = now
+        self._last_write = now
+
+    def close(self) -> None:
+        """Flush anything still buffered"""
+        self._flush()
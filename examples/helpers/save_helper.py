@@ -3,13 +3,25 @@
 # Helper module for creating conversation folders and saving conversation data
 # Handles adding WAV headers to raw PCM audio data from Voice Agent API for proper playback
 
+import os
 import re
-import datetime
-import inspect
+import time
 import sys
 import struct
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
+
+# Patterns used to normalize text and build slugs, compiled once
+PUNCTUATION_RE = re.compile(r"[^\w\s]")
+WHITESPACE_RE = re.compile(r"\s+")
+SLUG_SEPARATOR_RE = re.compile(r"[^a-z0-9]+")
+
+# Any bytes-like object that can be written to a file without copying
+Buffer = Union[bytes, bytearray, memoryview]
+
+# 44-byte PCM WAV header: RIFF chunk, fmt subchunk, then the data subchunk header
+WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
 
 
 def normalize_text(text: str) -> str:
@@ -23,13 +35,14 @@ def normalize_text(text: str) -> str:
         Normalized text
     """
     # Remove punctuation and convert to lowercase
-    text = re.sub(r"[^\w\s]", "", text.lower())
+    text = PUNCTUATION_RE.sub("", text.lower())
     # Replace multiple whitespace with a single space
-    text = re.sub(r"\s+", " ", text)
+    text = WHITESPACE_RE.sub(" ", text)
     # Strip leading and trailing whitespace
     return text.strip()
 
 
+@lru_cache(maxsize=1)
 def get_project_root() -> Path:
     """
     Get the project root directory
@@ -51,30 +64,23 @@ def get_caller_script_name() -> str:
     Returns:
         The name of the calling script without extension
     """
-    # Get the current call stack
-    stack = inspect.stack()
-
-    # Start from index 1 to skip the current function
-    # and go up the stack to find the first __main__ caller
-    main_caller = None
-    for frame in stack[1:]:
-        module = inspect.getmodule(frame[0])
-        if module:
-            if module.__name__ == "__main__":
-                main_caller = frame
-                break
-
-    # If we found a main caller, get its filename
-    if main_caller:
-        filename = Path(main_caller.filename).stem
-        return filename
-
-    # If we can't find a __main__ caller, try to get the parent module name
-    for frame in stack[1:]:
-        module = inspect.getmodule(frame[0])
-        if module and module.__name__ != __name__:
+    # Walk the frames directly rather than building inspect.stack(), which
+    # resolves source context for every frame. Start from the caller and look
+    # for the first __main__ frame, remembering the first foreign module
+    fallback = None
+    frame = sys._getframe(1)
+    while frame is not None:
+        module_name = frame.f_globals.get("__name__")
+        if module_name == "__main__":
+            return Path(frame.f_code.co_filename).stem
+        if fallback is None and module_name and module_name != __name__:
             # Get just the last part of the module name (e.g., 'basic' from 'examples.voice_agent.basic')
-            return module.__name__.split(".")[-1]
+            fallback = module_name.split(".")[-1]
+        frame = frame.f_back
+
+    # If we can't find a __main__ caller, use the parent module name
+    if fallback is not None:
+        return fallback
 
     # Fallback to the main script name in sys.argv[0]
     return Path(sys.argv[0]).stem
@@ -92,7 +98,7 @@ def create_slug(text: str, max_length: int = 30) -> str:
         A URL-friendly slug
     """
     # Convert to lowercase and replace special chars with hyphens
-    slug = re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+    slug = SLUG_SEPARATOR_RE.sub("-", text.lower()).strip("-")
     # Truncate to max length
     if len(slug) > max_length:
         slug = slug[:max_length].rstrip("-")
@@ -119,22 +125,20 @@ def create_conversation_folder(text: str, base_dir: Optional[Path] = None) -> Pa
     topic_slug = create_slug(topic)
 
     # Create folder with timestamp
-    timestamp = datetime.datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
+    timestamp = time.strftime("%Y-%m-%d-%H-%M-%S")
 
     # Prefix the folder name with the script name
     folder_name = f"{script_name}_{topic_slug}-{timestamp}"
 
-    # Create conversations directory if it doesn't exist
+    # Default to the conversations directory at the project root
     if base_dir is None:
         # Use the project root directory
         project_root = get_project_root()
         base_dir = project_root / "conversations"
 
-    base_dir.mkdir(exist_ok=True)
-
-    # Create conversation-specific directory
+    # Create conversation-specific directory, along with base_dir if needed
     conversation_dir = base_dir / folder_name
-    conversation_dir.mkdir(exist_ok=True)
+    conversation_dir.mkdir(parents=True, exist_ok=True)
 
     print(f"📁 Created conversation folder: {conversation_dir}")
     return conversation_dir
@@ -158,16 +162,17 @@ def save_conversation_log(
     """
     log_path = conversation_dir / filename
 
-    with open(log_path, "w") as f:
-        f.write("=== Conversation Log ===\n\n")
-        for msg in conversation:
-            timestamp = msg.get(
-                "timestamp", datetime.datetime.now().strftime("%H:%M:%S")
-            )
-            role = msg.get("role", "unknown")
-            # Try to get content first (new format), fall back to text (old format)
-            content = msg.get("content", msg.get("text", ""))
-            f.write(f"[{timestamp}] {role.upper()}: {content}\n\n")
+    # Messages without a timestamp all share one fallback, formatted once
+    fallback_timestamp = time.strftime("%H:%M:%S")
+
+    # Try to get content first (new format), fall back to text (old format)
+    entries = "".join(
+        f"[{msg.get('timestamp', fallback_timestamp)}] "
+        f"{msg.get('role', 'unknown').upper()}: "
+        f"{msg.get('content', msg.get('text', ''))}\n\n"
+        for msg in conversation
+    )
+    log_path.write_text("=== Conversation Log ===\n\n" + entries)
 
     print(f"📝 Saved conversation log to {log_path}")
     return log_path
@@ -191,61 +196,101 @@ def create_wav_header(
     Returns:
         WAV header as bytes
     """
-    # RIFF header
-    header = bytearray()
-    header.extend(b"RIFF")
-    header.extend(struct.pack("<I", 36 + data_length))  # File size - 8
-    header.extend(b"WAVE")
-
-    # FMT subchunk
-    header.extend(b"fmt ")
-    header.extend(struct.pack("<I", 16))  # Subchunk1Size (16 for PCM)
-    header.extend(struct.pack("<H", 1))  # AudioFormat (1 for PCM)
-    header.extend(struct.pack("<H", num_channels))  # NumChannels
-    header.extend(struct.pack("<I", sample_rate))  # SampleRate
-
     bytes_per_sample = bits_per_sample // 8
     byte_rate = sample_rate * num_channels * bytes_per_sample
     block_align = num_channels * bytes_per_sample
 
-    header.extend(struct.pack("<I", byte_rate))  # ByteRate
-    header.extend(struct.pack("<H", block_align))  # BlockAlign
-    header.extend(struct.pack("<H", bits_per_sample))  # BitsPerSample
-
-    # Data subchunk
-    header.extend(b"data")
-    header.extend(struct.pack("<I", data_length))  # Subchunk2Size
+    return WAV_HEADER.pack(
+        b"RIFF",
+        36 + data_length,  # File size - 8
+        b"WAVE",
+        b"fmt ",
+        16,  # Subchunk1Size (16 for PCM)
+        1,  # AudioFormat (1 for PCM)
+        num_channels,
+        sample_rate,
+        byte_rate,
+        block_align,
+        bits_per_sample,
+        b"data",
+        data_length,  # Subchunk2Size
+    )
+
+
+def write_buffers(path: Path, buffers: List[Buffer]) -> None:
+    """
+    Write several buffers to a file, using a single gather write where supported
 
-    return bytes(header)
+    Args:
+        path: File to create or truncate
+        buffers: Buffers to write, in order
+    """
+    if not hasattr(os, "writev"):
+        # Windows has no writev; fall back to buffered writes
+        with open(path, "wb") as f:
+            for buffer in buffers:
+                f.write(buffer)
+        return
+
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        written = os.writev(fd, buffers)
+
+        # writev may stop short on very large buffers, so finish off the rest
+        for buffer in buffers:
+            if written >= len(buffer):
+                written -= len(buffer)
+                continue
+            view = memoryview(buffer)[written:]
+            written = 0
+            while view:
+                view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
 
 
 def save_audio_file(
     conversation_dir: Path,
-    audio_data: bytes,
+    audio_data: Buffer,
     file_index: int,
     role: str,
     extension: str = "wav",
     sample_rate: int = 24000,
+    raw_pcm: Optional[bool] = None,
 ) -> Path:
     """
     Save audio data to a file in the conversation directory.
     For WAV files, automatically adds proper WAV headers to raw PCM data.
 
+    Audio may be any bytes-like object and is written without being copied,
+    so callers holding a large receive buffer should pass
+    memoryview(buffer)[start:end] rather than slicing out a new bytes object.
+
     Args:
         conversation_dir: Directory to save the audio file
-        audio_data: The audio data to save
+        audio_data: The audio data to save (bytes, bytearray or memoryview)
         file_index: The index/order of the audio file
         role: The role of the speaker ("user" or "agent")
         extension: The file extension to use
         sample_rate: Sample rate in Hz (for WAV header if needed)
+        raw_pcm: True if the audio is known to be headerless PCM, False if it
+            should be written as is, or None to detect it from the data
 
     Returns:
         Path to the saved audio file
     """
     audio_path = conversation_dir / f"{file_index}-{role}.{extension}"
 
-    # If it's a WAV file, prepend WAV header for raw PCM data
-    if extension.lower() == "wav" and not audio_data.startswith(b"RIFF"):
+    # View the audio as flat bytes so lengths and the header probe work the
+    # same for bytes, bytearray and memoryview input
+    audio_data = memoryview(audio_data).cast("B")
+
+    # Trust the caller when it knows the format, otherwise probe for a header
+    if raw_pcm is None:
+        raw_pcm = extension.lower() == "wav" and audio_data[:4] != b"RIFF"
+
+    # If it's raw PCM, prepend a WAV header
+    if raw_pcm:
         # Add WAV header to raw PCM data
         wav_header = create_wav_header(
             sample_rate=sample_rate,
@@ -253,9 +298,7 @@ def save_audio_file(
             bits_per_sample=16,  # 16-bit PCM
             data_length=len(audio_data),
         )
-        with open(audio_path, "wb") as f:
-            f.write(wav_header)
-            f.write(audio_data)
+        write_buffers(audio_path, [wav_header, audio_data])
         print(
             f"✅ Saved {role} audio to {audio_path} ({len(audio_data)} bytes + {len(wav_header)} byte header)"
         )
@@ -4,6 +4,7 @@
 
 import asyncio
 import time
+from functools import lru_cache
 
 
 async def send_continuous_silence(websocket, last_event_time_ref, silence_timeout=5):
@@ -23,30 +24,41 @@ async def send_continuous_silence(websocket, last_event_time_ref, silence_timeou
     silence_frame = create_silence_frame(100)  # 100ms of silence (0.1s)
     silence_count = 0
 
+    # Pace frames against fixed deadlines so time spent in send() doesn't drift
+    loop = asyncio.get_running_loop()
+    next_send = loop.time()
+
     try:
         while True:
             # Check if we should stop silence based on timeout
-            current_time = time.time()
-            if current_time - last_event_time_ref[0] > silence_timeout:
+            idle_time = time.time() - last_event_time_ref[0]
+            if idle_time > silence_timeout:
                 print(
                     f"⏱️ Silence timeout reached ({silence_timeout}s since last event), stopping continuous silence"
                 )
                 return
 
+            # Sleep until the next frame is due to simulate real microphone rate
+            # (0.1s per frame), waking early to re-check the timeout if it
+            # expires first
+            delay = next_send - loop.time()
+            if delay > 0:
+                await asyncio.sleep(min(delay, silence_timeout - idle_time))
+                continue
+
             # Send silence frame
             await websocket.send(silence_frame)
             silence_count += 1
+            next_send += 0.1
 
             # Log every 30 frames (3 seconds)
             if silence_count % 30 == 0:
                 print(f"🔊 Sent {silence_count} silence frames so far")
-
-            # Sleep to simulate real microphone rate (0.1s per frame)
-            await asyncio.sleep(0.1)
     except Exception as e:
         print(f"⚠️ Silence task error: {e}")
 
 
+@lru_cache(maxsize=8)
 def create_silence_frame(duration_ms=100, sample_rate=16000):
     """
     Create a frame of silence for the specified duration
@@ -59,7 +71,7 @@ def create_silence_frame(duration_ms=100, sample_rate=16000):
         Bytes object containing the silence frame
     """
     # Calculate number of bytes needed for silence frame
-    # 2 bytes per sample (16-bit PCM)
-    num_bytes = (duration_ms / 1000) * sample_rate * 2
-    # Create and return the silence frame
-    return b"\x00" * int(num_bytes)
+    # 2 bytes per sample (16-bit PCM), in integer math to skip the float round trip
+    num_bytes = duration_ms * sample_rate * 2 // 1000
+    # Create and return the silence frame (bytes(n) is zero-filled)
+    return bytes(num_bytes)
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# sse_helper.py
+# Helper module for reading server-sent events from streamed chat completions
+
+# Server-sent event framing, matched against the raw response bytes
+SSE_DATA_PREFIX = b"data: "
+SSE_DONE = b"[DONE]"
+SSE_DATA_PREFIX_LENGTH = len(SSE_DATA_PREFIX)
+
+
+def iter_sse_lines(response):
+    """
+    Yield each line of a streamed response as raw bytes
+
+    Args:
+        response: A streaming httpx response
+
+    Yields:
+        Each line without its trailing newline
+    """
+    buffer = bytearray()
+    for chunk in response.iter_bytes():
+        buffer += chunk
+
+        # Slice every complete line out of the buffer, then drop them at once
+        start = 0
+        end = buffer.find(b"\n", start)
+        while end != -1:
+            yield bytes(buffer[start:end]).rstrip(b"\r")
+            start = end + 1
+            end = buffer.find(b"\n", start)
+        del buffer[:start]
+
+    if buffer:
+        yield bytes(buffer).rstrip(b"\r")
+
+
+def iter_sse_data(response):
+    """
+    Yield the payload of every `data:` event until the stream is done
+
+    Payloads are left as bytes so they can be handed straight to orjson.
+
+    Args:
+        response: A streaming httpx response
+
+    Yields:
+        The raw JSON payload of each event
+    """
+    for line in iter_sse_lines(response):
+        # A slice comparison skips the method lookup and call of startswith()
+        if line[:SSE_DATA_PREFIX_LENGTH] != SSE_DATA_PREFIX:
+            continue
+
+        data = line[SSE_DATA_PREFIX_LENGTH:]
+        if data == SSE_DONE:
+            return
+
+        yield data
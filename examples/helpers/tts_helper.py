@@ -3,26 +3,219 @@
 # A helper module for text-to-speech functionality using Deepgram's TTS API
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import aiohttp
+import asyncio
+import hashlib
+import io
+import logging
 import os
+import shutil
+import tempfile
 import time
 import argparse
-from typing import Optional, Tuple, Dict, Any
+from functools import lru_cache
+from typing import Optional, Tuple, Dict, Any, List, Iterator, AsyncIterator
+import orjson
 from dotenv import load_dotenv
 
+# Progress messages are formatted lazily, only when INFO logging is enabled
+logger = logging.getLogger(__name__)
+
+# Directory of this helper and the project root (2 directories up from this file)
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(SCRIPT_DIR, "..", ".."))
+
+# Fixed .env file locations, checked after the current working directory
+ENV_PATHS = (
+    os.path.join(SCRIPT_DIR, ".env"),  # Script directory
+    os.path.join(ROOT_DIR, ".env"),  # Project root
+    os.path.expanduser("~/.env"),  # User's home directory
+)
+
+# Block size for copying streamed audio to its destination
+COPY_BUFFER_SIZE = 65536
+
+# Read size used when urllib3 can't return partial data (1.x has no read1);
+# a read only returns once its block is full, so this is kept small
+FIRST_READ_SIZE = 1024
+
+# Placeholder audio returned by dry runs for non-PCM encodings, shared by every call
+DRY_RUN_AUDIO = b"DUMMY_AUDIO_DATA" * 1000
+
+
+@lru_cache(maxsize=8)
+def dry_run_pcm(sample_rate: int) -> bytes:
+    """
+    Get one second of silent linear16 audio for dry runs
+
+    The result is immutable, so one buffer per sample rate is shared by every call.
+
+    Args:
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        Silent PCM audio
+    """
+    return bytes(sample_rate * 2)
+
+
+@lru_cache(maxsize=1)
+def load_env_files() -> None:
+    """
+    Load environment variables from the first .env file found
+
+    Only the first call touches the filesystem; later calls are free.
+    """
+    # List of potential env file locations in order of precedence
+    env_paths = (os.path.join(os.getcwd(), ".env"),) + ENV_PATHS
+
+    logger.info("Loading environment variables from: %s", list(env_paths))
+
+    # Try loading from each location
+    for env_path in env_paths:
+        if os.path.exists(env_path):
+            logger.info("Loading environment from: %s", env_path)
+            load_dotenv(env_path)
+            break
+
+
+class DiskTTSCache:
+    """Content-addressed disk cache for generated speech with LRU eviction"""
+
+    def __init__(self, cache_dir: str, max_bytes: int = 200 << 20):
+        """
+        Initialize the cache
+
+        Args:
+            cache_dir: Directory to store cached audio in (created if missing)
+            max_bytes: Total size of cached audio to keep before evicting
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(text: str, params: Dict[str, Any]) -> str:
+        """
+        Build a cache key from the text and request parameters
+
+        Args:
+            text: The text being synthesized
+            params: The TTS request parameters (model, encoding, sample rate, ...)
+
+        Returns:
+            Hex SHA-256 digest of the canonical request
+        """
+        canonical = orjson.dumps({"text": text, **params}, option=orjson.OPT_SORT_KEYS)
+        return hashlib.sha256(canonical).hexdigest()
+
+    def _paths(self, key: str) -> Tuple[str, str]:
+        """Return the audio and metadata paths for a key"""
+        base = os.path.join(self.cache_dir, key)
+        return f"{base}.audio", f"{base}.json"
+
+    def get(self, key: str) -> Optional[Tuple[bytes, str]]:
+        """
+        Look up cached audio
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Tuple of (audio_bytes, content_type), or None on a miss
+        """
+        audio_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path, "rb") as f:
+                content_type = orjson.loads(f.read())["content_type"]
+            with open(audio_path, "rb") as f:
+                audio_data = f.read()
+            # Mark the entry as recently used, even on noatime mounts
+            os.utime(audio_path)
+        except (OSError, ValueError, KeyError):
+            return None
+        return audio_data, content_type
+
+    def put(self, key: str, audio_data: bytes, content_type: str) -> None:
+        """
+        Store audio in the cache, then evict old entries if over budget
+
+        Args:
+            key: Cache key from make_key()
+            audio_data: The synthesized audio
+            content_type: Content type returned by the API
+        """
+        audio_path, meta_path = self._paths(key)
+        # Write the audio before its metadata so a reader never sees a partial
+        # entry; each file is swapped into place atomically
+        self._write_atomic(audio_path, audio_data)
+        self._write_atomic(meta_path, orjson.dumps({"content_type": content_type}))
+        self._evict()
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes) -> None:
+        """Write data to a unique temporary file and rename it over path"""
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries until the cache fits max_bytes"""
+        entries = []
+        total = 0
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".audio"):
+                    stat = entry.stat()
+                    entries.append((stat.st_atime, stat.st_size, entry.name[:-6]))
+                    total += stat.st_size
+
+        if total <= self.max_bytes:
+            return
+
+        entries.sort()
+        for _, size, key in entries:
+            for path in self._paths(key):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+            total -= size
+            if total <= self.max_bytes:
+                break
+
 
 class DeepgramTTS:
     """Helper class for interacting with Deepgram's Text-to-Speech API"""
 
-    def __init__(self, api_key: Optional[str] = None, dry_run: bool = False):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        dry_run: bool = False,
+        cache_dir: Optional[str] = None,
+        cache_max_bytes: int = 200 << 20,
+    ):
         """
         Initialize the TTS helper
 
         Args:
             api_key: Deepgram API key (will use DEEPGRAM_API_KEY from env vars if not provided)
             dry_run: If True, skip actual API calls and use dummy data (for testing)
+            cache_dir: Optional directory for caching generated speech on disk
+            cache_max_bytes: Maximum size of the disk cache in bytes
         """
         # Load environment variables from .env files
-        self._load_env_files()
+        load_env_files()
 
         # Get API key from args, env var, or raise error
         self.api_key = api_key or os.environ.get("DEEPGRAM_API_KEY")
@@ -37,31 +230,40 @@ class DeepgramTTS:
             "Content-Type": "application/json",
         }
         self.dry_run = dry_run
+        self.cache = DiskTTSCache(cache_dir, cache_max_bytes) if cache_dir else None
+
+        # Keep connections to the TTS API alive so repeated calls skip the
+        # TCP and TLS handshakes. Synthesizing the same text twice is harmless,
+        # so POSTs are retried briefly on gateway errors; once retries run out
+        # the last response is returned for the usual status check.
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=8,
+                pool_maxsize=32,
+                max_retries=Retry(
+                    total=2,
+                    backoff_factor=0.1,
+                    status_forcelist=[502, 503, 504],
+                    allowed_methods=frozenset({"POST"}),
+                    raise_on_status=False,
+                ),
+            ),
+        )
 
-    def _load_env_files(self):
-        """Load environment variables from multiple possible .env file locations"""
-        # Try to load from project root .env file (2 directories up from this file)
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        root_dir = os.path.abspath(os.path.join(script_dir, "..", ".."))
-
-        # List of potential env file locations in order of precedence
-        env_paths = [
-            os.path.join(os.getcwd(), ".env"),  # Current working directory
-            os.path.join(script_dir, ".env"),  # Script directory
-            os.path.join(root_dir, ".env"),  # Project root
-            os.path.expanduser("~/.env"),  # User's home directory
-        ]
-
-        print(f"Loading environment variables from: {env_paths}")
-
-        # Try loading from each location
-        for env_path in env_paths:
-            if os.path.exists(env_path):
-                print(f"Loading environment from: {env_path}")
-                load_dotenv(env_path)
-                break
+        # Created lazily on first async use, since it must belong to a running loop
+        self._async_session: Optional[aiohttp.ClientSession] = None
+
+    def __enter__(self) -> "DeepgramTTS":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
-        print(f"Environment variables loaded {os.environ.get('DEEPGRAM_API_KEY')}")
+    def close(self) -> None:
+        """Close the connection pool used by the sync methods"""
+        self._session.close()
 
     def generate_speech(
         self,
@@ -87,68 +289,354 @@ class DeepgramTTS:
             Tuple of (audio_bytes, content_type)
         """
         # Build request parameters
-        params = {"model": model, "encoding": encoding, "sample_rate": sample_rate}
-
-        if container:
-            params["container"] = container
+        params = self._build_params(model, encoding, sample_rate, container)
 
         # Build request body
         data = {"text": text}
 
         # Make the API request
-        print(
-            f"Generating speech for text: '{text[:50]}{'...' if len(text) > 50 else ''}'"
-        )
-        start_time = time.time()
+        self._log_request("Generating", text)
+        start_time = time.perf_counter()
+
+        # Serve repeated requests from the disk cache when one is configured
+        cached = self._cache_get(text, params)
 
         if self.dry_run:
-            # In dry run mode, generate dummy audio data
-            print("[DRY RUN] Simulating API call")
-            # Create a simple sine wave as dummy audio data
-            if encoding == "linear16":
-                # Generate 1 second of silent PCM audio (linear16)
-                audio_data = bytes(sample_rate * 2)  # 1 second of silence
-                content_type = "audio/l16"
-            else:
-                # For other formats, just create some dummy bytes
-                audio_data = b"DUMMY_AUDIO_DATA" * 1000
-                content_type = f"audio/{encoding}"
+            audio_data, content_type = self._dry_run_speech(encoding, sample_rate)
+        elif cached is not None:
+            audio_data, content_type = cached
         else:
             # Make the actual API request
-            response = requests.post(
-                self.base_url, headers=self.headers, params=params, json=data
+            response = self._session.post(
+                self.base_url,
+                headers=self.headers,
+                params=params,
+                data=orjson.dumps(data),
             )
 
             # Check for errors
             if response.status_code != 200:
-                error_msg = f"TTS API error: {response.status_code}"
-                try:
-                    error_data = response.json()
-                    error_msg = f"{error_msg} - {error_data.get('message', '')}"
-                except:
-                    pass
-                raise Exception(error_msg)
+                self._raise_for_error(response.status_code, response.content)
 
             # Get content type and audio data
             content_type = response.headers.get("Content-Type", "")
             audio_data = response.content
+            self._cache_put(text, params, audio_data, content_type)
 
-        duration = time.time() - start_time
-        print(f"Generated {len(audio_data)} bytes of audio in {duration:.2f}s")
+        duration = time.perf_counter() - start_time
+        logger.info("Generated %d bytes of audio in %.2fs", len(audio_data), duration)
 
         # Save to file if requested
         if output_file:
             with open(output_file, "wb") as f:
                 f.write(audio_data)
-            print(f"Saved audio to {output_file}")
+            logger.info("Saved audio to %s", output_file)
+
+        return audio_data, content_type
+
+    async def agenerate_speech(
+        self,
+        text: str,
+        model: str = "aura-2-andromeda-en",
+        encoding: str = "linear16",
+        sample_rate: int = 16000,
+        container: Optional[str] = None,
+        output_file: Optional[str] = None,
+    ) -> Tuple[bytes, str]:
+        """
+        Generate speech from text without blocking the event loop
+
+        Takes the same arguments as generate_speech. Call aclose(), or use the
+        client as an async context manager, to release its connection pools.
+
+        Returns:
+            Tuple of (audio_bytes, content_type)
+        """
+        # Build request parameters
+        params = self._build_params(model, encoding, sample_rate, container)
+
+        # Build request body
+        data = {"text": text}
+
+        # Make the API request
+        self._log_request("Generating", text)
+        start_time = time.perf_counter()
+
+        # Serve repeated requests from the disk cache when one is configured,
+        # skipping the thread pool hop entirely when there is nothing to look up
+        cached = None
+        if self.cache is not None and not self.dry_run:
+            cached = await asyncio.to_thread(self._cache_get, text, params)
+
+        if self.dry_run:
+            audio_data, content_type = self._dry_run_speech(encoding, sample_rate)
+        elif cached is not None:
+            audio_data, content_type = cached
+        else:
+            session = self._get_async_session()
+            async with session.post(
+                self.base_url,
+                headers=self.headers,
+                params=params,
+                data=orjson.dumps(data),
+            ) as response:
+                # Check for errors
+                if response.status != 200:
+                    self._raise_for_error(response.status, await response.read())
+
+                # Get content type and audio data
+                content_type = response.headers.get("Content-Type", "")
+                chunks = [chunk async for chunk in response.content.iter_chunked(4096)]
+                audio_data = b"".join(chunks)
+
+            if self.cache is not None:
+                await asyncio.to_thread(
+                    self._cache_put, text, params, audio_data, content_type
+                )
+
+        duration = time.perf_counter() - start_time
+        logger.info("Generated %d bytes of audio in %.2fs", len(audio_data), duration)
+
+        # Save to file if requested, off the event loop
+        if output_file:
+            await asyncio.to_thread(self._write_audio_file, output_file, audio_data)
+            logger.info("Saved audio to %s", output_file)
 
         return audio_data, content_type
 
+    def stream_speech(
+        self,
+        text: str,
+        model: str = "aura-2-andromeda-en",
+        encoding: str = "linear16",
+        sample_rate: int = 16000,
+        container: Optional[str] = None,
+    ) -> Iterator[bytes]:
+        """
+        Stream speech from text, yielding audio as soon as it arrives
+
+        Lets callers start playback at the first byte instead of waiting for
+        the whole response. Takes the same arguments as generate_speech.
+
+        Yields:
+            Chunks of audio data
+        """
+        # Build request parameters
+        params = self._build_params(model, encoding, sample_rate, container)
+
+        self._log_request("Streaming", text)
+
+        if self.dry_run:
+            yield self._dry_run_speech(encoding, sample_rate)[0]
+            return
+
+        with self._session.post(
+            self.base_url,
+            headers=self.headers,
+            params=params,
+            data=orjson.dumps({"text": text}),
+            stream=True,
+        ) as response:
+            # Check for errors
+            if response.status_code != 200:
+                self._raise_for_error(response.status_code, response.content)
+
+            # Yield whatever has arrived rather than waiting to fill a block, so
+            # the first audio isn't held back (iter_content(chunk_size=None)
+            # reads a Content-Length body in one go)
+            raw = response.raw
+            raw.decode_content = True
+            chunk = self._read_available(raw)
+            while chunk:
+                yield chunk
+                chunk = self._read_available(raw)
+
+    async def astream_speech(
+        self,
+        text: str,
+        model: str = "aura-2-andromeda-en",
+        encoding: str = "linear16",
+        sample_rate: int = 16000,
+        container: Optional[str] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream speech from text without blocking the event loop
+
+        Takes the same arguments as stream_speech. Call aclose(), or use the
+        client as an async context manager, to release its connection pools.
+
+        Yields:
+            Chunks of audio data
+        """
+        # Build request parameters
+        params = self._build_params(model, encoding, sample_rate, container)
+
+        self._log_request("Streaming", text)
+
+        if self.dry_run:
+            yield self._dry_run_speech(encoding, sample_rate)[0]
+            return
+
+        session = self._get_async_session()
+        async with session.post(
+            self.base_url,
+            headers=self.headers,
+            params=params,
+            data=orjson.dumps({"text": text}),
+        ) as response:
+            # Check for errors
+            if response.status != 200:
+                self._raise_for_error(response.status, await response.read())
+
+            # iter_any yields whatever has arrived, without waiting to fill a block
+            async for chunk in response.content.iter_any():
+                yield chunk
+
+    async def agenerate_many(
+        self, texts: List[str], concurrency: int = 3, **kwargs
+    ) -> List[Tuple[bytes, str]]:
+        """
+        Generate speech for several texts with overlapping requests
+
+        Args:
+            texts: The texts to convert to speech
+            concurrency: Maximum number of requests in flight at once
+            **kwargs: Additional arguments to pass to agenerate_speech
+                (other than output_file, which would be shared by every text)
+
+        Returns:
+            List of (audio_bytes, content_type) tuples in the same order as texts
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def generate(text: str) -> Tuple[bytes, str]:
+            async with semaphore:
+                return await self.agenerate_speech(text, **kwargs)
+
+        # gather keeps results in submission order however they complete
+        return list(await asyncio.gather(*[generate(text) for text in texts]))
+
+    async def __aenter__(self) -> "DeepgramTTS":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the connection pools used by both the async and sync methods"""
+        if self._async_session is not None:
+            await self._async_session.close()
+            self._async_session = None
+        self._session.close()
+
+    def _get_async_session(self) -> aiohttp.ClientSession:
+        """Return the shared aiohttp session, creating it on first use"""
+        if self._async_session is None or self._async_session.closed:
+            self._async_session = aiohttp.ClientSession()
+        return self._async_session
+
+    def _cache_get(
+        self, text: str, params: Dict[str, Any]
+    ) -> Optional[Tuple[bytes, str]]:
+        """Look up previously generated speech, if caching is enabled"""
+        if self.cache is None or self.dry_run:
+            return None
+        return self.cache.get(DiskTTSCache.make_key(text, params))
+
+    def _cache_put(
+        self, text: str, params: Dict[str, Any], audio_data: bytes, content_type: str
+    ) -> None:
+        """Store generated speech, if caching is enabled"""
+        if self.cache is not None:
+            key = DiskTTSCache.make_key(text, params)
+            self.cache.put(key, audio_data, content_type)
+
+    @staticmethod
+    def _build_params(
+        model: str, encoding: str, sample_rate: int, container: Optional[str]
+    ) -> Dict[str, Any]:
+        """Build the TTS query parameters, leaving out an unset container"""
+        params = {"model": model, "encoding": encoding, "sample_rate": sample_rate}
+        if container:
+            params["container"] = container
+        return params
+
+    @staticmethod
+    def _log_request(action: str, text: str) -> None:
+        """Log the start of a request with a preview of its text"""
+        logger.info(
+            "%s speech for text: '%.50s%s'",
+            action,
+            text,
+            "..." if len(text) > 50 else "",
+        )
+
+    @staticmethod
+    def _raise_for_error(status: int, body: bytes) -> None:
+        """
+        Raise an exception for a failed TTS request
+
+        Args:
+            status: HTTP status code of the response
+            body: Response body, which may hold a JSON error message
+        """
+        error_msg = f"TTS API error: {status}"
+        try:
+            error_data = orjson.loads(body)
+        except ValueError:
+            error_data = None
+        if isinstance(error_data, dict):
+            error_msg = f"{error_msg} - {error_data.get('message', '')}"
+        raise Exception(error_msg)
+
+    @staticmethod
+    def _read_available(raw) -> bytes:
+        """
+        Read the next part of a streamed body without waiting to fill a large block
+
+        Args:
+            raw: The urllib3 response behind a streaming requests response
+
+        Returns:
+            The bytes read, or b"" once the body is exhausted
+        """
+        # urllib3 2.x returns whatever has already arrived; older versions block
+        # until the requested size is read, so ask them for only a little
+        read1 = getattr(raw, "read1", None)
+        if read1 is not None:
+            return read1(COPY_BUFFER_SIZE)
+        return raw.read(FIRST_READ_SIZE)
+
+    @staticmethod
+    def _write_audio_file(output_file: str, audio_data: bytes) -> None:
+        """Write audio data to a file"""
+        with open(output_file, "wb") as f:
+            f.write(audio_data)
+
+    def _dry_run_speech(self, encoding: str, sample_rate: int) -> Tuple[bytes, str]:
+        """
+        Build dummy audio data in place of an API call
+
+        Args:
+            encoding: Audio encoding requested
+            sample_rate: Sample rate in Hz requested
+
+        Returns:
+            Tuple of (audio_bytes, content_type)
+        """
+        logger.info("[DRY RUN] Simulating API call")
+        if encoding == "linear16":
+            # Generate 1 second of silent PCM audio (linear16)
+            return dry_run_pcm(sample_rate), "audio/l16"
+        # For other formats, just create some dummy bytes
+        return DRY_RUN_AUDIO, f"audio/{encoding}"
+
     def generate_speech_with_metrics(
         self,
         text: str,
         model: str = "aura-2-thalia-en",
         output_file: Optional[str] = None,
+        keep_audio: bool = True,
     ) -> Dict[str, Any]:
         """
         Generate speech with detailed timing metrics similar to curl's --write-out option
@@ -157,6 +645,8 @@ class DeepgramTTS:
             text: The text to convert to speech
             model: TTS model to use (default: aura-2-thalia-en)
             output_file: Optional file path to save the audio
+            keep_audio: If False, only write the audio to output_file and
+                return None as the audio data
 
         Returns:
             Dictionary with audio data, content type, and timing metrics
@@ -168,13 +658,11 @@ class DeepgramTTS:
         data = {"text": text}
 
         # Make the API request
-        print(
-            f"Generating speech for text: '{text[:50]}{'...' if len(text) > 50 else ''}'"
-        )
+        self._log_request("Generating", text)
 
         if self.dry_run:
             return {
-                "audio_data": b"DUMMY_AUDIO_DATA" * 1000,
+                "audio_data": DRY_RUN_AUDIO,
                 "content_type": "audio/mp3",
                 "metrics": {
                     "time_to_first_byte": 0.1,
@@ -183,53 +671,58 @@ class DeepgramTTS:
                 },
             }
 
-        # Use requests with a session to get timing metrics
-        session = requests.Session()
-
         # Track start time
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Prepare request
         request = requests.Request(
-            "POST", self.base_url, headers=self.headers, params=params, json=data
+            "POST",
+            self.base_url,
+            headers=self.headers,
+            params=params,
+            data=orjson.dumps(data),
         )
-        prepped = session.prepare_request(request)
+        prepped = self._session.prepare_request(request)
 
         # Send request and monitor timing
         first_byte_time = None
-        response = session.send(prepped, stream=True)
+        response = self._session.send(prepped, stream=True)
 
         # Check for errors
         if response.status_code != 200:
-            error_msg = f"TTS API error: {response.status_code}"
-            try:
-                error_data = response.json()
-                error_msg = f"{error_msg} - {error_data.get('message', '')}"
-            except:
-                pass
-            raise Exception(error_msg)
-
-        # Stream the response and capture timing metrics
-        content = bytearray()
-        for chunk in response.iter_content(chunk_size=128):
-            if first_byte_time is None:
-                first_byte_time = time.time()
-            content.extend(chunk)
+            self._raise_for_error(response.status_code, response.content)
+
+        # Time the first bytes with a read that returns as soon as data arrives,
+        # since a large block would only come back once filled, then copy the
+        # rest of the body in large blocks
+        raw = response.raw
+        raw.decode_content = True
+        first_chunk = self._read_available(raw)
+        if first_chunk:
+            first_byte_time = time.perf_counter()
+
+        # Write straight to disk unless the caller also wants the audio back
+        stream_to_file = bool(output_file) and not keep_audio
+        with open(output_file, "wb") if stream_to_file else io.BytesIO() as dest:
+            dest.write(first_chunk)
+            shutil.copyfileobj(raw, dest, COPY_BUFFER_SIZE)
+            end_time = time.perf_counter()
+            audio_data = None if stream_to_file else dest.getvalue()
 
         # Calculate final timings
-        end_time = time.time()
         time_to_first_byte = first_byte_time - start_time if first_byte_time else 0
         time_to_last_byte = end_time - start_time
 
         # Get content type
         content_type = response.headers.get("Content-Type", "")
-        audio_data = bytes(content)
 
-        # Save to file if requested
-        if output_file:
+        # Save to file if requested and not already streamed there
+        if output_file and not stream_to_file:
             with open(output_file, "wb") as f:
                 f.write(audio_data)
-            print(f"Saved audio to {output_file}")
+
+        if output_file:
+            logger.info("Saved audio to %s", output_file)
 
         # Return audio data with metrics
         return {
@@ -258,8 +751,10 @@ class DeepgramTTS:
         kwargs.setdefault("sample_rate", 16000)
         kwargs.setdefault("container", None)  # No container for raw PCM
 
-        print(
-            f"Creating voice agent input file with encoding={kwargs['encoding']}, sample_rate={kwargs['sample_rate']}"
+        logger.info(
+            "Creating voice agent input file with encoding=%s, sample_rate=%s",
+            kwargs["encoding"],
+            kwargs["sample_rate"],
         )
 
         # Generate speech and save to file
@@ -283,11 +778,14 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
+    # Show the helper's progress messages when run directly
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     tts = DeepgramTTS(api_key=args.api_key, dry_run=args.dry_run)
 
     # Use the metrics version by default (matching curl example)
     result = tts.generate_speech_with_metrics(
-        text=args.text, model=args.model, output_file=args.output
+        text=args.text, model=args.model, output_file=args.output, keep_audio=False
     )
     metrics = result["metrics"]
     print(f"Audio file created: {args.output}")
@@ -310,15 +808,15 @@ def quick_tts(text, output_file, api_key=None):
     Returns:
         Dictionary with timing metrics
     """
-    tts = DeepgramTTS(api_key=api_key)
-    # Use voice agent compatible settings
-    result = tts.generate_speech(
-        text=text,
-        encoding="linear16",
-        sample_rate=16000,
-        container=None,
-        output_file=output_file,
-    )
+    with DeepgramTTS(api_key=api_key) as tts:
+        # Use voice agent compatible settings
+        result = tts.generate_speech(
+            text=text,
+            encoding="linear16",
+            sample_rate=16000,
+            container=None,
+            output_file=output_file,
+        )
 
     # Calculate some basic metrics
     metrics = {
@@ -329,8 +827,10 @@ def quick_tts(text, output_file, api_key=None):
         "file_size_bytes": len(result[0]),
     }
 
-    print(
-        f"Generated {metrics['file_size_bytes']} bytes of audio with sample rate {metrics['sample_rate']}Hz"
+    logger.info(
+        "Generated %d bytes of audio with sample rate %dHz",
+        metrics["file_size_bytes"],
+        metrics["sample_rate"],
     )
 
     return metrics
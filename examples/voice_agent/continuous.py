@@ -5,7 +5,7 @@
 
 import os
 import asyncio
-import json
+import orjson
 import websockets
 import time
 import argparse
@@ -73,30 +73,27 @@ async def main(
     # This is separate from our conversation log and only used for generating continuations
     completion_helper.add_message("user", text)
 
-    # Convert initial message to audio
-    user_audio_path = conversation_dir / "1-user.wav"
-    audio_data, _ = tts.generate_speech(
-        text=text,
-        model=USER_TTS_MODEL,
-        encoding="linear16",  # Voice Agent expects linear16 (PCM)
-        sample_rate=16000,  # Use 16kHz for compatibility
-        container=None,  # Raw PCM
-        output_file=str(user_audio_path),
-    )
-    print(f"✅ Generated and saved user audio to {user_audio_path}")
-
     # We don't add the user message to our conversation log here
     # Let the ConversationText event handle it
 
     try:
-        # Load audio bytes
-        with open(user_audio_path, "rb") as f:
-            audio_bytes = f.read()
+        # Convert initial message to audio
+        user_audio_path = conversation_dir / "1-user.wav"
+        audio_data, _ = await tts.agenerate_speech(
+            text=text,
+            model=USER_TTS_MODEL,
+            encoding="linear16",  # Voice Agent expects linear16 (PCM)
+            sample_rate=16000,  # Use 16kHz for compatibility
+            container=None,  # Raw PCM
+            output_file=str(user_audio_path),
+        )
+        print(f"✅ Generated and saved user audio to {user_audio_path}")
 
         # Connect to local Gnosis Voice Agent proxy
         print(f"🔄 Connecting to local Gnosis Voice Agent at {GNOSIS_URL}")
 
-        async with websockets.connect(GNOSIS_URL) as websocket:
+        # Audio frames don't compress, so skip permessage-deflate entirely
+        async with websockets.connect(GNOSIS_URL, compression=None) as websocket:
             print("✅ Connected successfully to Gnosis")
 
             # Receive welcome message
@@ -134,7 +131,8 @@ async def main(
                 },
             }
 
-            await websocket.send(json.dumps(settings))
+            # Send as text; the proxy treats binary frames as audio
+            await websocket.send(orjson.dumps(settings).decode())
 
             # Track time of last event (any message from server)
             last_event_time = time.time()
@@ -147,9 +145,12 @@ async def main(
                 response = await websocket.recv()
                 last_event_time = time.time()
                 last_event_time_ref[0] = last_event_time
-                if isinstance(response, str):
+                # Only parse frames that could name one of the types we wait for
+                if isinstance(response, str) and (
+                    '"SettingsApplied"' in response or '"Error"' in response
+                ):
                     try:
-                        data = json.loads(response)
+                        data = orjson.loads(response)
                         if data.get("type") == "SettingsApplied":
                             settings_applied = True
                             print("✅ Settings applied, sending audio...")
@@ -166,23 +167,28 @@ async def main(
                 # Send audio data (rate-limited to simulate real microphone)
                 bytes_per_second = 32000  # 16kHz 16-bit PCM
                 total_size = len(audio_bytes)
-                chunks_sent = 0
-                start_time = time.time()
+                # Slice chunks out of a view so each send shares the original buffer
+                audio_view = memoryview(audio_bytes)
+
+                # Each send is due when the audio before it would have finished
+                # playing, measured on the loop's monotonic clock so time spent
+                # sending never accumulates as drift
+                loop = asyncio.get_running_loop()
+                next_send = loop.time()
 
                 print(f"🎤 Sending audio: {total_size} bytes")
 
                 # Send in chunks
                 for i in range(0, total_size, chunk_size):
-                    chunk = audio_bytes[i : i + chunk_size]
-                    chunks_sent += 1
+                    chunk = audio_view[i : i + chunk_size]
 
                     await websocket.send(chunk)
 
                     # Rate limit to simulate real-time audio
-                    elapsed = time.time() - start_time
-                    expected_time = (chunks_sent * chunk_size) / bytes_per_second
-                    if elapsed < expected_time:
-                        await asyncio.sleep(expected_time - elapsed)
+                    next_send += len(chunk) / bytes_per_second
+                    delay = next_send - loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
 
                 # Send silence frames to indicate end of speech
                 silence_frame = create_silence_frame(100)  # 100ms of silence
@@ -192,14 +198,13 @@ async def main(
 
                 # Send silence frames with the same rate limiting
                 for i in range(silence_frames_to_send):
-                    chunks_sent += 1
                     await websocket.send(silence_frame)
 
                     # Rate limit consistently with previous audio
-                    elapsed = time.time() - start_time
-                    expected_time = (chunks_sent * 3200) / bytes_per_second
-                    if elapsed < expected_time:
-                        await asyncio.sleep(expected_time - elapsed)
+                    next_send += len(silence_frame) / bytes_per_second
+                    delay = next_send - loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
 
                 print(
                     f"✅ Audio sent: {total_size} bytes + {silence_frames_to_send} silence frames"
@@ -225,13 +230,14 @@ async def main(
                             print(f"🔊 Received audio chunk: {len(response)} bytes")
                             # Update last_event_time for binary messages (audio chunks) too
                             last_event_time = time.time()
+                            last_event_time_ref[0] = last_event_time
                         else:
                             # Update last event time for non-binary messages
                             last_event_time = time.time()
                             last_event_time_ref[0] = last_event_time
 
                             try:
-                                data = json.loads(response)
+                                data = orjson.loads(response)
                                 msg_type = data.get("type", "")
 
                                 print(f"📨 Received message: {msg_type}")
@@ -279,6 +285,7 @@ async def main(
                                             role="agent",
                                             extension="wav",
                                             sample_rate=24000,  # Match the output sample rate in settings
+                                            raw_pcm=True,  # The Voice Agent API sends headerless linear16
                                         )
                                         print(
                                             f"✅ Saved agent audio to {agent_audio_path} ({len(agent_audio_data)} bytes)"
@@ -305,7 +312,7 @@ async def main(
                                             conversation_dir
                                             / f"{audio_turn_counter}-user.wav"
                                         )
-                                        next_audio_data, _ = tts.generate_speech(
+                                        next_audio_data, _ = await tts.agenerate_speech(
                                             text=user_response,
                                             model=USER_TTS_MODEL,
                                             encoding="linear16",
@@ -317,11 +324,9 @@ async def main(
                                             f"✅ Saved user continuation audio to {next_user_audio_path}"
                                         )
 
-                                        # Send the audio
-                                        with open(next_user_audio_path, "rb") as f:
-                                            next_audio_bytes = f.read()
+                                        # Send the audio, already in memory from generation
                                         await send_audio_data(
-                                            next_audio_bytes, CHUNK_SIZE
+                                            next_audio_data, CHUNK_SIZE
                                         )
 
                                         # Reset for next turn
@@ -354,11 +359,11 @@ async def main(
 
                                     print(f"❌ Error: {error_display}")
                                     print(
-                                        f"Full error details: {json.dumps(data, indent=2)}"
+                                        f"Full error details: {orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()}"
                                     )
                                     return
 
-                            except json.JSONDecodeError:
+                            except orjson.JSONDecodeError:
                                 print(f"⚠️ Received non-JSON string: {response[:100]}")
 
                     except websockets.exceptions.ConnectionClosed:
@@ -377,8 +382,8 @@ async def main(
             # Start message processing in the background
             process_task = asyncio.create_task(process_messages())
 
-            # Send audio data
-            await send_audio_data(audio_bytes, CHUNK_SIZE)
+            # Send the generated audio straight from memory
+            await send_audio_data(audio_data, CHUNK_SIZE)
 
             # Start continuous silence transmission
             silence_task = asyncio.create_task(
@@ -388,18 +393,6 @@ async def main(
                 "🔊 Started continuous silence transmission (open microphone simulation)"
             )
 
-            # Update the event time reference whenever we receive an event
-            async def update_event_time():
-                """Update the event time reference whenever a message is processed"""
-                nonlocal last_event_time, last_event_time_ref
-                while True:
-                    await asyncio.sleep(0.1)  # Check every 100ms
-                    if last_event_time > last_event_time_ref[0]:
-                        last_event_time_ref[0] = last_event_time
-
-            # Start time updater
-            time_updater_task = asyncio.create_task(update_event_time())
-
             # Wait for the conversation to complete
             try:
                 # Wait for processing to complete (happens when we reach max turns)
@@ -415,13 +408,6 @@ async def main(
                     except asyncio.CancelledError:
                         pass
 
-                if time_updater_task and not time_updater_task.done():
-                    time_updater_task.cancel()
-                    try:
-                        await time_updater_task
-                    except asyncio.CancelledError:
-                        pass
-
                 if process_task and not process_task.done():
                     process_task.cancel()
                     try:
@@ -434,6 +420,9 @@ async def main(
     except Exception as e:
         print(f"❌ Error: {str(e)}")
     finally:
+        # Release both TTS connection pools
+        await tts.aclose()
+
         print(f"🧹 Conversation saved in {conversation_dir}")
 
         # Display playback instructions
@@ -3,7 +3,7 @@
 # Simple example of interacting with the Voice Agent API via local Gnosis server
 
 import asyncio
-import json
+import orjson
 import websockets
 import argparse
 import os
@@ -56,8 +56,8 @@ def get_weather(location):
         "wind_kph": random.randint(0, 30),
     }
 
-    print(f"🌤️ Weather response: {json.dumps(weather_data)}")
-    return json.dumps(weather_data)
+    print(f"🌤️ Weather response: {orjson.dumps(weather_data).decode()}")
+    return orjson.dumps(weather_data).decode()
 
 
 async def main(
@@ -89,29 +89,26 @@ async def main(
     # Generate audio from text
     print(f"📢 Converting text to speech: '{text}'")
 
-    # Generate audio file directly in the conversation folder
-    user_audio_path = conversation_dir / "1-user.wav"
-    audio_data, _ = tts.generate_speech(
-        text=text,
-        model=USER_TTS_MODEL,
-        encoding="linear16",  # Voice Agent expects linear16 (PCM)
-        sample_rate=16000,  # Use 16kHz for compatibility
-        container=None,  # Raw PCM
-        output_file=str(user_audio_path),
-    )
-    print(f"✅ Generated and saved user audio to {user_audio_path}")
-
     # We no longer add the user message to conversation here
     # Let the ConversationText event handle it
 
     try:
-        # Load audio bytes
-        with open(user_audio_path, "rb") as f:
-            audio_bytes = f.read()
+        # Generate audio file directly in the conversation folder
+        user_audio_path = conversation_dir / "1-user.wav"
+        audio_data, _ = await tts.agenerate_speech(
+            text=text,
+            model=USER_TTS_MODEL,
+            encoding="linear16",  # Voice Agent expects linear16 (PCM)
+            sample_rate=16000,  # Use 16kHz for compatibility
+            container=None,  # Raw PCM
+            output_file=str(user_audio_path),
+        )
+        print(f"✅ Generated and saved user audio to {user_audio_path}")
 
         # Connect to WebSocket
         print(f"🔄 Connecting to local Gnosis Voice Agent at {GNOSIS_URL}")
-        async with websockets.connect(GNOSIS_URL) as websocket:
+        # Audio frames don't compress, so skip permessage-deflate entirely
+        async with websockets.connect(GNOSIS_URL, compression=None) as websocket:
             print("✅ Connected successfully")
 
             # Receive welcome message
@@ -165,7 +162,8 @@ async def main(
                 },
             }
 
-            await websocket.send(json.dumps(settings))
+            # Send as text; the proxy treats binary frames as audio
+            await websocket.send(orjson.dumps(settings).decode())
 
             # Track last event time for silence handling
             last_event_time = time.time()
@@ -179,9 +177,12 @@ async def main(
                 last_event_time = time.time()
                 last_event_time_ref[0] = last_event_time
 
-                if isinstance(response, str):
+                # Only parse frames that could name one of the types we wait for
+                if isinstance(response, str) and (
+                    '"SettingsApplied"' in response or '"Error"' in response
+                ):
                     try:
-                        data = json.loads(response)
+                        data = orjson.loads(response)
                         if data.get("type") == "SettingsApplied":
                             settings_applied = True
                             print("✅ Settings applied, sending audio...")
@@ -198,23 +199,28 @@ async def main(
                 # Send audio data (rate-limited to simulate real microphone)
                 bytes_per_second = 32000  # 16kHz 16-bit PCM
                 total_size = len(audio_bytes)
-                chunks_sent = 0
-                start_time = time.time()
+                # Slice chunks out of a view so each send shares the original buffer
+                audio_view = memoryview(audio_bytes)
+
+                # Each send is due when the audio before it would have finished
+                # playing, measured on the loop's monotonic clock so time spent
+                # sending never accumulates as drift
+                loop = asyncio.get_running_loop()
+                next_send = loop.time()
 
                 print(f"🎤 Sending audio: {total_size} bytes")
 
                 # Send in chunks
                 for i in range(0, total_size, chunk_size):
-                    chunk = audio_bytes[i : i + chunk_size]
-                    chunks_sent += 1
+                    chunk = audio_view[i : i + chunk_size]
 
                     await websocket.send(chunk)
 
                     # Rate limit to simulate real-time audio
-                    elapsed = time.time() - start_time
-                    expected_time = (chunks_sent * chunk_size) / bytes_per_second
-                    if elapsed < expected_time:
-                        await asyncio.sleep(expected_time - elapsed)
+                    next_send += len(chunk) / bytes_per_second
+                    delay = next_send - loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
 
                 # Send silence frames to indicate end of speech
                 silence_frame = create_silence_frame(100)  # 100ms of silence
@@ -224,14 +230,13 @@ async def main(
 
                 # Send silence frames with the same rate limiting
                 for i in range(silence_frames_to_send):
-                    chunks_sent += 1
                     await websocket.send(silence_frame)
 
                     # Rate limit consistently with previous audio
-                    elapsed = time.time() - start_time
-                    expected_time = (chunks_sent * 3200) / bytes_per_second
-                    if elapsed < expected_time:
-                        await asyncio.sleep(expected_time - elapsed)
+                    next_send += len(silence_frame) / bytes_per_second
+                    delay = next_send - loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
 
                 print(
                     f"✅ Audio sent: {total_size} bytes + {silence_frames_to_send} silence frames"
@@ -257,7 +262,7 @@ async def main(
                             last_event_time_ref[0] = last_event_time
 
                             try:
-                                data = json.loads(response)
+                                data = orjson.loads(response)
                                 msg_type = data.get("type", "")
 
                                 print(f"📨 Received message: {msg_type}")
@@ -310,8 +315,8 @@ async def main(
 
                                         # Parse arguments
                                         try:
-                                            args = json.loads(arguments_str)
-                                        except json.JSONDecodeError:
+                                            args = orjson.loads(arguments_str)
+                                        except orjson.JSONDecodeError:
                                             args = {}
 
                                         # Handle function calls
@@ -344,7 +349,7 @@ async def main(
                                                 "content": result,
                                             }
                                             await websocket.send(
-                                                json.dumps(function_response)
+                                                orjson.dumps(function_response).decode()
                                             )
                                             print(
                                                 f"✅ Sent function response for {function_name}"
@@ -362,6 +367,7 @@ async def main(
                                             role="agent",
                                             extension="wav",
                                             sample_rate=24000,  # Match the output sample rate in settings
+                                            raw_pcm=True,  # The Voice Agent API sends headerless linear16
                                         )
                                         print(
                                             f"🔊 Saved agent audio on connection close to {agent_audio_path} ({len(agent_audio_data)} bytes)"
@@ -390,11 +396,11 @@ async def main(
 
                                     print(f"❌ Error: {error_display}")
                                     print(
-                                        f"Full error details: {json.dumps(data, indent=2)}"
+                                        f"Full error details: {orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()}"
                                     )
                                     return
 
-                            except json.JSONDecodeError:
+                            except orjson.JSONDecodeError:
                                 print(f"⚠️ Received non-JSON string: {response[:100]}")
                 except websockets.exceptions.ConnectionClosed:
                     print("🔌 WebSocket connection closed")
@@ -408,6 +414,7 @@ async def main(
                             role="agent",
                             extension="wav",
                             sample_rate=24000,  # Match the output sample rate in settings
+                            raw_pcm=True,  # The Voice Agent API sends headerless linear16
                         )
                         print(
                             f"🔊 Saved agent audio on connection close to {agent_audio_path} ({len(agent_audio_data)} bytes)"
@@ -417,8 +424,8 @@ async def main(
             # Start message processing in the background
             process_task = asyncio.create_task(process_messages())
 
-            # Send audio data
-            await send_audio_data(audio_bytes, CHUNK_SIZE)
+            # Send the generated audio straight from memory
+            await send_audio_data(audio_data, CHUNK_SIZE)
 
             # Start continuous silence transmission
             silence_task = asyncio.create_task(
@@ -428,18 +435,6 @@ async def main(
                 "🔊 Started continuous silence transmission (open microphone simulation)"
             )
 
-            # Update the event time reference whenever we receive an event
-            async def update_event_time():
-                """Update the event time reference whenever a message is processed"""
-                nonlocal last_event_time, last_event_time_ref
-                while True:
-                    await asyncio.sleep(0.1)  # Check every 100ms
-                    if last_event_time > last_event_time_ref[0]:
-                        last_event_time_ref[0] = last_event_time
-
-            # Start time updater
-            time_updater_task = asyncio.create_task(update_event_time())
-
             # Wait for the response or timeout
             try:
                 # Wait for processing to complete (happens when we get a response)
@@ -455,13 +450,6 @@ async def main(
                     except asyncio.CancelledError:
                         pass
 
-                if time_updater_task and not time_updater_task.done():
-                    time_updater_task.cancel()
-                    try:
-                        await time_updater_task
-                    except asyncio.CancelledError:
-                        pass
-
                 if process_task and not process_task.done():
                     process_task.cancel()
                     try:
@@ -479,7 +467,9 @@ async def main(
             print("✅ Voice agent interaction complete")
 
     finally:
-        # Display playback instructions
+        # Release both TTS connection pools
+        await tts.aclose()
+
         print(f"🧹 Conversation saved in {conversation_dir}")
 
         # Display playback instructions
@@ -0,0 +1,73 @@
+import pytest
+from litestar.response import Response
+
+from app.services.tools.vector_search import (
+    MAX_BATCH_QUERIES,
+    search_documentation,
+    search_documentation_batch,
+)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("query", ["", "   ", "a", "?!", None])
+async def test_search_documentation_skips_degenerate_queries(mocker, query):
+    """
+    Test that empty, whitespace and punctuation-only queries never hit the API.
+    """
+    search = mocker.patch(
+        "app.services.openai.OpenAIService.search_vector_store",
+    )
+
+    result = await search_documentation({"query": query})
+
+    assert result["data"] == []
+    search.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("limit, expected", [(10000, 2), (0, 1), ("bad", 2), (1, 1)])
+async def test_search_documentation_clamps_limit(mocker, limit, expected):
+    """
+    Test that the result limit is clamped to the range the tool advertises.
+    """
+    search = mocker.patch(
+        "app.services.openai.OpenAIService.search_vector_store",
+        return_value=Response(content=b'{"data": []}', status_code=200),
+    )
+
+    await search_documentation({"query": "nova-3 model", "limit": limit})
+
+    assert search.call_args.kwargs["data"].max_num_results == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("queries", [None, "nova-3", ["nova-3", 3], {"q": "nova-3"}])
+async def test_search_documentation_batch_rejects_invalid_queries(mocker, queries):
+    """
+    Test that a batch without a list of strings is rejected before any search.
+    """
+    search = mocker.patch(
+        "app.services.openai.OpenAIService.search_vector_store",
+    )
+
+    result = await search_documentation_batch({"queries": queries})
+
+    assert "error" in result
+    search.assert_not_called()
+
+
+@pytest.mark.unit
+async def test_search_documentation_batch_caps_and_filters_queries(mocker):
+    """
+    Test that batches are capped and degenerate queries never hit the API.
+    """
+    search = mocker.patch(
+        "app.services.openai.OpenAIService.search_vector_store",
+        return_value=Response(content=b'{"data": []}', status_code=200),
+    )
+    queries = ["?!"] + [f"nova-3 question {i}" for i in range(MAX_BATCH_QUERIES * 2)]
+
+    result = await search_documentation_batch({"queries": queries})
+
+    assert len(result["results"]) == MAX_BATCH_QUERIES
+    assert search.call_count == MAX_BATCH_QUERIES - 1